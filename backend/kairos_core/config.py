@@ -1,26 +1,47 @@
-from pydantic import BaseModel
+import functools
 import os
 
+from pydantic import BaseModel
+
+# Environment is read (and coerced) exactly once at import; Settings field
+# defaults reference these constants instead of hitting os.getenv again.
+_DIALOGFLOW_PROJECT_ID = os.getenv("DIALOGFLOW_PROJECT_ID")
+_DIALOGFLOW_LOCATION = os.getenv("DIALOGFLOW_LOCATION", "us-central1")
+_DIALOGFLOW_AGENT_ID = os.getenv("DIALOGFLOW_AGENT_ID")
+_DIALOGFLOW_SONG_ENTITY = os.getenv("DIALOGFLOW_SONG_ENTITY", "SongName")
+_PROP_HOST = os.getenv("PROP_HOST", "127.0.0.1")
+_PROP_PORT = int(os.getenv("PROP_PORT", "53535"))
+_PROP_PASSWORD = os.getenv("PROP_PASSWORD")
+_NLU_THRESHOLD = float(os.getenv("NLU_THRESHOLD", "0.8"))
+
 
 class Settings(BaseModel):
     # External services (placeholders; load from env in real integration)
     google_project_id: str | None = None
-    dialogflow_project_id: str | None = os.getenv("DIALOGFLOW_PROJECT_ID")
-    dialogflow_location: str | None = os.getenv("DIALOGFLOW_LOCATION", "us-central1")
-    dialogflow_agent_id: str | None = os.getenv("DIALOGFLOW_AGENT_ID")
-    dialogflow_song_entity: str = os.getenv("DIALOGFLOW_SONG_ENTITY", "SongName")
+    dialogflow_project_id: str | None = _DIALOGFLOW_PROJECT_ID
+    dialogflow_location: str | None = _DIALOGFLOW_LOCATION
+    dialogflow_agent_id: str | None = _DIALOGFLOW_AGENT_ID
+    dialogflow_song_entity: str = _DIALOGFLOW_SONG_ENTITY
     acrcloud_host: str | None = None
     acrcloud_key: str | None = None
     acrcloud_secret: str | None = None
 
     # ProPresenter
-    propresenter_host: str = os.getenv("PROP_HOST", "127.0.0.1")
-    propresenter_port: int = int(os.getenv("PROP_PORT", "53535"))
-    propresenter_password: str | None = os.getenv("PROP_PASSWORD")
+    propresenter_host: str = _PROP_HOST
+    propresenter_port: int = _PROP_PORT
+    propresenter_password: str | None = _PROP_PASSWORD
 
     # Behavior
-    nlu_confidence_threshold: float = float(os.getenv("NLU_THRESHOLD", "0.8"))
+    nlu_confidence_threshold: float = _NLU_THRESHOLD
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    # Env vars are read at process start; the instance is immutable for our
+    # purposes, so one cached copy serves every caller on the hot path.
     return Settings()
+
+
+def reset_settings_cache() -> None:
+    """Drop the cached Settings (tests that tweak env vars call this)."""
+    get_settings.cache_clear()
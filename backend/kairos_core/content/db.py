@@ -1,35 +1,109 @@
+import contextlib
 import os
+import queue
 import sqlite3
-from typing import Iterable, Optional
+import threading
+from typing import Optional
 
 DB_PATH = os.path.join("backend", "data", "kairos.db")
+POOL_SIZE = int(os.getenv("KAIROS_DB_POOL_SIZE", "5"))
+
+# Applied once per connection at open time instead of per request.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
 
 
 def _ensure_dirs() -> None:
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
 
 
-def get_conn() -> sqlite3.Connection:
-    _ensure_dirs()
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+class ConnectionPool:
+    """Fixed-size pool of long-lived SQLite connections.
+
+    Opening a fresh connection per request re-maps the WAL/SHM files and
+    re-runs pragma setup on every call; keeping a small set of connections
+    open for the process lifetime avoids that. Writes are serialized by a
+    shared lock since SQLite allows a single writer anyway.
+    """
+
+    def __init__(self, path: str, size: int = POOL_SIZE) -> None:
+        self.path = path
+        self.write_lock = threading.Lock()
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=size)
+        for _ in range(size):
+            self._pool.put(self._open())
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        return self._pool.get()
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        self._pool.put(conn)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_guard = threading.Lock()
+
+
+def _get_pool() -> ConnectionPool:
+    global _pool
+    with _pool_guard:
+        # Rebuild when DB_PATH is repointed (tests monkeypatch it).
+        if _pool is None or _pool.path != DB_PATH:
+            if _pool is not None:
+                _pool.close()
+            _ensure_dirs()
+            _pool = ConnectionPool(DB_PATH)
+        return _pool
 
 
 def get_db():
-    conn = get_conn()
+    pool = _get_pool()
+    conn = pool.acquire()
     try:
         yield conn
     finally:
-        conn.close()
+        pool.release(conn)
+
+
+@contextlib.contextmanager
+def db_connection():
+    """Context-managed pool checkout for use outside FastAPI dependencies.
+
+    Calling next(get_db()) by hand runs only up to the yield, so the
+    release in its finally never fires and the connection leaks from the
+    pool. Code that cannot use Depends should use this instead.
+    """
+    pool = _get_pool()
+    conn = pool.acquire()
+    try:
+        yield conn
+    finally:
+        pool.release(conn)
 
 
 def init_db() -> None:
-    _ensure_dirs()
-    conn = get_conn()
+    pool = _get_pool()
+    conn = pool.acquire()
     try:
-        cur = conn.cursor()
-        cur.execute(
+        conn.execute(
             """
             CREATE TABLE IF NOT EXISTS songs (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -38,28 +112,38 @@ def init_db() -> None:
             )
             """
         )
+        # get_identifier_by_title filters on lower(title); without this
+        # expression index SQLite lowercases every row on each lookup.
+        conn.execute("CREATE INDEX IF NOT EXISTS songs_title_lower ON songs(lower(title))")
         conn.commit()
     finally:
-        conn.close()
+        pool.release(conn)
 
 
-def list_songs(conn: sqlite3.Connection) -> Iterable[sqlite3.Row]:
+def list_songs(conn: sqlite3.Connection) -> "list[sqlite3.Row]":
+    # The fetchall is load-bearing: the portal handlers run this under
+    # asyncio.to_thread, so the query must execute and materialize here,
+    # in the worker thread — returning the lazy cursor would defer the
+    # real work to template render time, back on the event loop.
     return conn.execute("SELECT id, title, identifier FROM songs ORDER BY title ASC").fetchall()
 
 
 def add_song(conn: sqlite3.Connection, title: str, identifier: str) -> int:
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT OR REPLACE INTO songs (title, identifier) VALUES (?, ?)",
-        (title.strip(), identifier.strip()),
-    )
-    conn.commit()
-    return cur.lastrowid or cur.execute("SELECT id FROM songs WHERE title = ?", (title.strip(),)).fetchone()[0]
+    clean_title = title.strip()
+    with _get_pool().write_lock:
+        cur = conn.cursor()
+        cur.execute(
+            "INSERT OR REPLACE INTO songs (title, identifier) VALUES (?, ?)",
+            (clean_title, identifier.strip()),
+        )
+        conn.commit()
+        return cur.lastrowid or cur.execute("SELECT id FROM songs WHERE title = ?", (clean_title,)).fetchone()[0]
 
 
 def delete_song(conn: sqlite3.Connection, song_id: int) -> None:
-    conn.execute("DELETE FROM songs WHERE id = ?", (song_id,))
-    conn.commit()
+    with _get_pool().write_lock:
+        conn.execute("DELETE FROM songs WHERE id = ?", (song_id,))
+        conn.commit()
 
 
 def get_identifier_by_title(conn: sqlite3.Connection, title: str) -> Optional[str]:
@@ -68,4 +152,3 @@ def get_identifier_by_title(conn: sqlite3.Connection, title: str) -> Optional[st
         (title.strip(),),
     ).fetchone()
     return row["identifier"] if row else None
-
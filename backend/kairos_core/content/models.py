@@ -7,6 +7,7 @@ class Song(BaseModel):
     identifier: str
 
 
-class SongCreate(BaseModel):n+    title: str
+class SongCreate(BaseModel):
+    title: str
     identifier: str
 
@@ -1,13 +1,27 @@
 from loguru import logger
 
-logger.add(
-    "backend/logs/kairos.log",
-    rotation="5 MB",
-    retention=5,
-    enqueue=True,
-    backtrace=True,
-    diagnose=False,
-)
+_file_sink_id: int | None = None
 
-__all__ = ["logger"]
 
+def configure_logging() -> None:
+    """Attach the rotating file sink.
+
+    Kept out of import time: adding the sink opens (and may create)
+    backend/logs/kairos.log, which is blocking disk I/O nothing should pay
+    just for importing this module. Writes themselves are handed to a
+    background thread via enqueue=True. Idempotent; call at app startup.
+    """
+    global _file_sink_id
+    if _file_sink_id is not None:
+        return
+    _file_sink_id = logger.add(
+        "backend/logs/kairos.log",
+        rotation="5 MB",
+        retention=5,
+        enqueue=True,
+        backtrace=True,
+        diagnose=False,
+    )
+
+
+__all__ = ["logger", "configure_logging"]
@@ -22,33 +22,43 @@ class ACRCloudClient(MusicIDClient):
         self.settings = get_settings()
         if not (self.settings.acrcloud_host and self.settings.acrcloud_key and self.settings.acrcloud_secret):
             raise RuntimeError("ACRCloud not configured")
+        # One client for the process: keeps the TLS connection to ACRCloud
+        # alive across identify calls instead of handshaking every time.
+        self._client = httpx.AsyncClient(timeout=6.0)
+        # Everything in the string-to-sign except the timestamp is constant,
+        # so bake the prefix and key bytes once.
+        self._sign_prefix = "\n".join(
+            ["POST", "/v1/identify", self.settings.acrcloud_key or "", "audio", "1", ""]
+        ).encode("utf-8")
+        self._sign_key = (self.settings.acrcloud_secret or "").encode("utf-8")
+
+    def _sign(self, timestamp: str) -> str:
+        digest = hmac.digest(self._sign_key, self._sign_prefix + timestamp.encode("ascii"), hashlib.sha1)
+        return base64.b64encode(digest).decode("ascii")
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
 
     async def identify(self, pcm_bytes: bytes) -> MusicIDResult:
-        # Construct signature per ACRCloud spec
-        http_method = "POST"
-        http_uri = "/v1/identify"
-        data_type = "audio"
-        signature_version = "1"
+        # Signature per ACRCloud spec; only the timestamp varies per call.
         timestamp = str(int(time.time()))
 
-        string_to_sign = "\n".join([http_method, http_uri, self.settings.acrcloud_key or "", data_type, signature_version, timestamp])
-        sign = base64.b64encode(hmac.new((self.settings.acrcloud_secret or "").encode("utf-8"), string_to_sign.encode("utf-8"), digestmod=hashlib.sha1).digest()).decode("utf-8")
-
         data = {
             "access_key": self.settings.acrcloud_key,
             "sample_bytes": str(len(pcm_bytes)),
-            "sample": base64.b64encode(pcm_bytes).decode("ascii"),
             "timestamp": timestamp,
-            "signature": sign,
-            "data_type": data_type,
-            "signature_version": signature_version,
+            "signature": self._sign(timestamp),
+            "data_type": "audio",
+            "signature_version": "1",
         }
+        # Upload the sample as a multipart file part: raw bytes on the wire
+        # instead of a base64 form field (-25% payload, no encode pass).
+        files = {"sample": ("sample", pcm_bytes, "application/octet-stream")}
 
         url = f"https://{self.settings.acrcloud_host}/v1/identify"
-        async with httpx.AsyncClient(timeout=6.0) as client:
-            resp = await client.post(url, data=data)
-            resp.raise_for_status()
-            j = resp.json()
+        resp = await self._client.post(url, data=data, files=files)
+        resp.raise_for_status()
+        j = resp.json()
 
         # Parse result
         title: Optional[str] = None
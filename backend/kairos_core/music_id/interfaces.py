@@ -3,6 +3,8 @@ from typing import Optional
 
 
 class MusicIDResult:
+    __slots__ = ("title", "artist", "confidence")
+
     def __init__(self, title: Optional[str], artist: Optional[str], confidence: float):
         self.title = title
         self.artist = artist
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
+import functools
 from typing import Iterable
 
-from google.cloud import dialogflowcx_v3 as dialogflowcx
-
 from kairos_core.config import get_settings
 
 
+@functools.lru_cache(maxsize=1)
+def _dfcx():
+    # Deferred so that importing the portal does not pay the grpc/proto
+    # import cost unless an entity sync actually runs.
+    from google.cloud import dialogflowcx_v3 as dialogflowcx
+
+    return dialogflowcx
+
+
+@functools.lru_cache(maxsize=1)
+def _entity_types_client():
+    # Client construction sets up a gRPC channel + auth; reuse it across syncs.
+    return _dfcx().EntityTypesClient()
+
+
 def _agent_path(settings) -> str:
-    return dialogflowcx.AgentsClient.agent_path(
+    return _dfcx().AgentsClient.agent_path(
         project=settings.dialogflow_project_id,
         location=settings.dialogflow_location,
         agent=settings.dialogflow_agent_id,
@@ -24,7 +38,8 @@ def sync_song_entity(titles: Iterable[str]) -> dict:
     if not (settings.dialogflow_project_id and settings.dialogflow_location and settings.dialogflow_agent_id):
         raise RuntimeError("Dialogflow CX settings not configured")
 
-    ent_client = dialogflowcx.EntityTypesClient()
+    dialogflowcx = _dfcx()
+    ent_client = _entity_types_client()
 
     # Find entity type by display name
     parent = _agent_path(settings)
@@ -38,14 +53,17 @@ def sync_song_entity(titles: Iterable[str]) -> dict:
 
     # Build entities: simple value with itself and lowercase as synonym
     entities = []
-    unique = set()
+    seen = set()
     for t in titles:
         v = (t or "").strip()
-        if not v or v.lower() in unique:
+        if not v:
+            continue
+        key = v.lower()
+        if key in seen:
             continue
-        unique.add(v.lower())
+        seen.add(key)
         entities.append(
-            dialogflowcx.EntityType.Entity(value=v, synonyms=[v, v.lower()])
+            dialogflowcx.EntityType.Entity(value=v, synonyms=[v, key])
         )
 
     updated = dialogflowcx.EntityType(
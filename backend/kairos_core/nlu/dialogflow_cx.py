@@ -1,32 +1,42 @@
 from __future__ import annotations
 
-import asyncio
+import functools
 import uuid
 from typing import Optional
 
-from google.cloud import dialogflowcx_v3 as dialogflowcx
-
 from kairos_core.config import get_settings
 from kairos_core.nlu.interfaces import NLUClient, NLUResult
 
 
+@functools.lru_cache(maxsize=1)
+def _dfcx():
+    # Deferred: importing dialogflowcx_v3 pulls in grpc + proto codegen
+    # (hundreds of ms) and should not tax deployments using rule-based NLU.
+    from google.cloud import dialogflowcx_v3 as dialogflowcx
+
+    return dialogflowcx
+
+
 class DialogflowCXClient(NLUClient):
     def __init__(self) -> None:
+        dialogflowcx = _dfcx()
         self.settings = get_settings()
         if not (self.settings.dialogflow_project_id and self.settings.dialogflow_location and self.settings.dialogflow_agent_id):
             raise RuntimeError("Dialogflow settings incomplete")
-        self._client = dialogflowcx.SessionsClient()
-
-    async def detect_intent(self, text: str, context: Optional[dict] = None) -> NLUResult:
-        return await asyncio.get_event_loop().run_in_executor(None, self._detect_sync, text, context or {})
-
-    def _detect_sync(self, text: str, context: dict) -> NLUResult:
-        session_path = self._client.session_path(
+        # Native async transport: detect_intent awaits the gRPC call directly
+        # instead of parking a worker thread per request.
+        self._client = dialogflowcx.SessionsAsyncClient()
+        # One conversation session per client instance: Dialogflow keeps
+        # context server-side and we skip building a new path per call.
+        self._session_path = self._client.session_path(
             project=self.settings.dialogflow_project_id,
             location=self.settings.dialogflow_location,
             agent=self.settings.dialogflow_agent_id,
             session=str(uuid.uuid4()),
         )
+
+    async def detect_intent(self, text: str, context: Optional[dict] = None) -> NLUResult:
+        dialogflowcx = _dfcx()
         text_input = dialogflowcx.TextInput(text=text)
         query_input = dialogflowcx.QueryInput(text=text_input, language_code="en-US")
 
@@ -36,11 +46,11 @@ class DialogflowCXClient(NLUClient):
             params = dialogflowcx.SessionParameters(fields={k: dialogflowcx.types.Value(string_value=str(v)) for k, v in context.items()})
 
         request = dialogflowcx.DetectIntentRequest(
-            session=session_path,
+            session=self._session_path,
             query_input=query_input,
             parameters=params,
         )
-        response = self._client.detect_intent(request=request)
+        response = await self._client.detect_intent(request=request)
 
         # Map result
         intent_name = "Fallback"
@@ -59,4 +69,3 @@ class DialogflowCXClient(NLUClient):
                     parameters[k] = v.string_value
 
         return NLUResult(intent=intent_name, params=parameters, confidence=confidence)
-
@@ -3,6 +3,8 @@ from typing import Optional
 
 
 class NLUResult:
+    __slots__ = ("intent", "params", "confidence")
+
     def __init__(self, intent: str, params: dict | None = None, confidence: float | None = None):
         self.intent = intent
         self.params = params or {}
@@ -6,6 +6,49 @@ from typing import Optional
 from kairos_core.nlu.interfaces import NLUClient, NLUResult
 
 
+# Keyword intents in one alternation compiled at import: a finditer pass
+# collects every hit and ladder rank decides, so "show next slide" stays
+# NextSlide even though "show" appears first in the string (a bare search
+# would take the leftmost match, not the highest-priority rule). The song
+# pattern lives outside the alternation: its greedy tail would otherwise
+# swallow later keywords out of the same scan.
+_KEYWORDS = re.compile(
+    r"(?P<clear>\b(?:clear|blank)(?: screen| lyrics)?\b)"
+    r"|(?P<next>\bnext(?: slide)?\b)"
+    r"|(?P<prev>\b(?:prev(?:ious)?|back)(?: slide)?\b)"
+    r"|(?P<section>\b(?:verse|chorus|bridge|tag|intro|outro)\s*\d*\b)"
+    r"|(?P<media>\b(?:play|pause|resume)(?: media| video| audio)?\b)",
+    re.IGNORECASE,
+)
+
+_SONG_RE = re.compile(r"\b(?:show|go to|open|lyrics for)\s+(?P<song_title>.+)$", re.IGNORECASE)
+
+# Ladder order, matching the old if-chain: clear, next, prev, song,
+# section, media.
+_INTENTS = {
+    "clear": ("ClearScreen", 0.9),
+    "next": ("NextSlide", 0.9),
+    "prev": ("PreviousSlide", 0.9),
+    "song": ("GoToSong", 0.8),
+    "section": ("GoToSection", 0.8),
+    "media": ("PlayPauseMedia", 0.8),
+}
+
+_PRIORITY = {name: rank for rank, name in enumerate(_INTENTS)}
+_SONG_RANK = _PRIORITY["song"]
+
+_POLITE = re.compile(r"\b(?:please|thanks)\b")
+
+# Every rule above is anchored on one of these trigger words; an utterance
+# containing none of them can skip the regex engine entirely. STT output is
+# punctuated, so strip it before tokenizing.
+_TRIGGERS = frozenset(
+    "clear blank next prev previous back show go open lyrics "
+    "verse chorus bridge tag intro outro play pause resume".split()
+)
+_PUNCT = str.maketrans("", "", ".,!?;:")
+
+
 class RuleBasedNLU(NLUClient):
     """Lightweight NLU for development and offline use.
 
@@ -14,37 +57,36 @@ class RuleBasedNLU(NLUClient):
 
     async def detect_intent(self, text: str, context: Optional[dict] = None) -> NLUResult:
         t = (text or "").strip().lower()
-        if not t:
+        if not t or _TRIGGERS.isdisjoint(t.translate(_PUNCT).split()):
             return NLUResult(intent="Fallback", params={}, confidence=0.0)
 
-        # Clear screen
-        if re.search(r"\b(clear|blank)( screen| lyrics)?\b", t):
-            return NLUResult(intent="ClearScreen", params={}, confidence=0.9)
-
-        # Next slide
-        if re.search(r"\b(next)( slide)?\b", t):
-            return NLUResult(intent="NextSlide", params={}, confidence=0.9)
+        best_rank = None
+        best_group = None
+        best_match = None
+        for m in _KEYWORDS.finditer(t):
+            rank = _PRIORITY[m.lastgroup]
+            if best_rank is None or rank < best_rank:
+                best_rank, best_group, best_match = rank, m.lastgroup, m
+                if rank == 0:
+                    break  # nothing can outrank the top entry
 
-        # Previous slide
-        if re.search(r"\b(prev(ious)?|back)( slide)?\b", t):
-            return NLUResult(intent="PreviousSlide", params={}, confidence=0.9)
+        # The song rule sits between prev and section in the ladder: it
+        # only applies when no higher-ranked keyword matched.
+        if best_rank is None or best_rank > _SONG_RANK:
+            m = _SONG_RE.search(t)
+            if m:
+                best_group, best_match = "song", m
 
-        # Go to song by common patterns
-        m = re.search(r"\b(show|go to|open|lyrics for)\s+(.+)$", t)
-        if m:
-            title = m.group(2).strip()
-            # remove trailing polite words
-            title = re.sub(r"\b(please|thanks)\b", "", title).strip()
-            return NLUResult(intent="GoToSong", params={"song_title": title}, confidence=0.8)
+        if best_group is None:
+            return NLUResult(intent="Fallback", params={}, confidence=0.0)
 
-        # Go to section
-        m2 = re.search(r"\b(verse|chorus|bridge|tag|intro|outro)\s*(\d+)?\b", t)
-        if m2:
-            sec = m2.group(0)
-            return NLUResult(intent="GoToSection", params={"section": sec}, confidence=0.8)
+        intent, confidence = _INTENTS[best_group]
 
-        # Play/pause
-        if re.search(r"\b(play|pause|resume)( media| video| audio)?\b", t):
-            return NLUResult(intent="PlayPauseMedia", params={}, confidence=0.8)
+        params: dict = {}
+        if best_group == "song":
+            # remove trailing polite words
+            params["song_title"] = _POLITE.sub("", best_match.group("song_title")).strip()
+        elif best_group == "section":
+            params["section"] = best_match.group("section")
 
-        return NLUResult(intent="Fallback", params={}, confidence=0.0)
+        return NLUResult(intent=intent, params=params, confidence=confidence)
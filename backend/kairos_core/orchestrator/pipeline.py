@@ -1,11 +1,22 @@
 from typing import Callable, Optional, Literal, Dict
 from pydantic import BaseModel
+import itertools
 import sqlite3
-import uuid
 
 from kairos_core.config import get_settings
 from kairos_core.content.db import get_identifier_by_title
 
+try:
+    import orjson
+
+    def _dumps(obj: dict) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:  # pragma: no cover - fallback when orjson is absent
+    import json
+
+    def _dumps(obj: dict) -> str:
+        return json.dumps(obj)
+
 
 class Intent(BaseModel):
     name: Literal[
@@ -21,100 +32,94 @@ class Intent(BaseModel):
 
 
 class Orchestrator:
+    # Intents whose action is a nullary ProPresenter call; handled by
+    # _handle_simple via the dispatch table below.
+    _SIMPLE_ACTIONS = {
+        "NextSlide": "next_slide",
+        "PreviousSlide": "previous_slide",
+        "ClearScreen": "clear_screen",
+        "PlayPauseMedia": "play_pause_media",
+    }
+
     def __init__(self, event_sink: Callable[[str], None], propresenter) -> None:
         self.emit = event_sink
         self.prop = propresenter
         self.settings = get_settings()
         self._pending: Dict[str, Intent] = {}
+        # Pending ids only need to be unique within this orchestrator's
+        # lifetime; a counter is far cheaper than a uuid4 per HITL prompt.
+        self._pending_ids = itertools.count(1)
         self._enabled: bool = True
+        self._dispatch = {
+            "GoToSong": self._handle_goto_song,
+            "GoToSection": self._handle_goto_section,
+        }
+        for name in self._SIMPLE_ACTIONS:
+            self._dispatch[name] = self._handle_simple
 
     async def handle_intent(self, intent: Intent, db: sqlite3.Connection) -> str:
         if not self._enabled:
             self.emit(self._json_event("info", {"msg": f"AI disabled; ignoring {intent.name}"}))
             return "disabled"
         conf = intent.confidence if intent.confidence is not None else 1.0
-        if intent.name == "GoToSong":
-            title = None
-            if intent.params:
-                title = intent.params.get("song_title") or intent.params.get("name")
-            if not title:
-                self.emit("HITL: Missing song title for GoToSong; no action")
-                return "needs_confirmation"
-            identifier = get_identifier_by_title(db, title)
-            if not identifier:
-                self.emit(f"HITL: Song '{title}' not found in mapping; no action")
-                return "not_found"
-            if conf < self.settings.nlu_confidence_threshold:
-                pid = self._queue_pending("GoToSong", {"song_title": title})
-                self.emit(
-                    self._json_event(
-                        "pending",
-                        {
-                            "id": pid,
-                            "intent": "GoToSong",
-                            "detail": f"Show '{title}'",
-                        },
-                    )
+        handler = self._dispatch.get(intent.name)
+        if handler is None:
+            self.emit(f"Unhandled intent: {intent.name}")
+            return "unhandled"
+        return await handler(intent, conf, db)
+
+    async def _handle_simple(self, intent: Intent, conf: float, db: sqlite3.Connection) -> str:
+        if conf < self.settings.nlu_confidence_threshold:
+            pid = self._queue_pending(intent.name, {})
+            self.emit(self._json_event("pending", {"id": pid, "intent": intent.name}))
+            return "needs_confirmation"
+        ok = await getattr(self.prop, self._SIMPLE_ACTIONS[intent.name])()
+        self.emit(f"Action: {intent.name} ({'ok' if ok else 'fail'})")
+        return "ok" if ok else "fail"
+
+    async def _handle_goto_song(self, intent: Intent, conf: float, db: sqlite3.Connection) -> str:
+        title = None
+        if intent.params:
+            title = intent.params.get("song_title") or intent.params.get("name")
+        if not title:
+            self.emit("HITL: Missing song title for GoToSong; no action")
+            return "needs_confirmation"
+        identifier = get_identifier_by_title(db, title)
+        if not identifier:
+            self.emit(f"HITL: Song '{title}' not found in mapping; no action")
+            return "not_found"
+        if conf < self.settings.nlu_confidence_threshold:
+            pid = self._queue_pending("GoToSong", {"song_title": title})
+            self.emit(
+                self._json_event(
+                    "pending",
+                    {
+                        "id": pid,
+                        "intent": "GoToSong",
+                        "detail": f"Show '{title}'",
+                    },
                 )
-                return "needs_confirmation"
-            ok = await self.prop.goto_song(identifier)
-            self.emit(f"Action: GoToSong -> {identifier} ({'ok' if ok else 'fail'})")
-            return "ok" if ok else "fail"
-
-        if intent.name == "NextSlide":
-            if conf < self.settings.nlu_confidence_threshold:
-                pid = self._queue_pending("NextSlide", {})
-                self.emit(self._json_event("pending", {"id": pid, "intent": "NextSlide"}))
-                return "needs_confirmation"
-            ok = await self.prop.next_slide()
-            self.emit(f"Action: NextSlide ({'ok' if ok else 'fail'})")
-            return "ok" if ok else "fail"
-
-        if intent.name == "PreviousSlide":
-            if conf < self.settings.nlu_confidence_threshold:
-                pid = self._queue_pending("PreviousSlide", {})
-                self.emit(self._json_event("pending", {"id": pid, "intent": "PreviousSlide"}))
-                return "needs_confirmation"
-            ok = await self.prop.previous_slide()
-            self.emit(f"Action: PreviousSlide ({'ok' if ok else 'fail'})")
-            return "ok" if ok else "fail"
-
-        if intent.name == "ClearScreen":
-            if conf < self.settings.nlu_confidence_threshold:
-                pid = self._queue_pending("ClearScreen", {})
-                self.emit(self._json_event("pending", {"id": pid, "intent": "ClearScreen"}))
-                return "needs_confirmation"
-            ok = await self.prop.clear_screen()
-            self.emit(f"Action: ClearScreen ({'ok' if ok else 'fail'})")
-            return "ok" if ok else "fail"
-
-        if intent.name == "GoToSection":
-            section = (intent.params or {}).get("section") if intent.params else None
-            if not section:
-                self.emit("HITL: Missing section for GoToSection; no action")
-                return "needs_confirmation"
-            if conf < self.settings.nlu_confidence_threshold:
-                pid = self._queue_pending("GoToSection", {"section": section})
-                self.emit(self._json_event("pending", {"id": pid, "intent": "GoToSection", "detail": section}))
-                return "needs_confirmation"
-            ok = await self.prop.goto_section(section)
-            self.emit(f"Action: GoToSection {section} ({'ok' if ok else 'fail'})")
-            return "ok" if ok else "fail"
-
-        if intent.name == "PlayPauseMedia":
-            if conf < self.settings.nlu_confidence_threshold:
-                pid = self._queue_pending("PlayPauseMedia", {})
-                self.emit(self._json_event("pending", {"id": pid, "intent": "PlayPauseMedia"}))
-                return "needs_confirmation"
-            ok = await self.prop.play_pause_media()
-            self.emit(f"Action: PlayPauseMedia ({'ok' if ok else 'fail'})")
-            return "ok" if ok else "fail"
-
-        self.emit(f"Unhandled intent: {intent.name}")
-        return "unhandled"
+            )
+            return "needs_confirmation"
+        ok = await self.prop.goto_song(identifier)
+        self.emit(f"Action: GoToSong -> {identifier} ({'ok' if ok else 'fail'})")
+        return "ok" if ok else "fail"
+
+    async def _handle_goto_section(self, intent: Intent, conf: float, db: sqlite3.Connection) -> str:
+        section = (intent.params or {}).get("section") if intent.params else None
+        if not section:
+            self.emit("HITL: Missing section for GoToSection; no action")
+            return "needs_confirmation"
+        if conf < self.settings.nlu_confidence_threshold:
+            pid = self._queue_pending("GoToSection", {"section": section})
+            self.emit(self._json_event("pending", {"id": pid, "intent": "GoToSection", "detail": section}))
+            return "needs_confirmation"
+        ok = await self.prop.goto_section(section)
+        self.emit(f"Action: GoToSection {section} ({'ok' if ok else 'fail'})")
+        return "ok" if ok else "fail"
 
     def _queue_pending(self, name: str, params: dict) -> str:
-        pid = str(uuid.uuid4())
+        pid = f"p{next(self._pending_ids)}"
         self._pending[pid] = Intent(name=name, params=params, confidence=1.0)
         return pid
 
@@ -135,10 +140,7 @@ class Orchestrator:
 
     @staticmethod
     def _json_event(kind: str, data: dict) -> str:
-        import json
-
-        payload = {"type": kind, **data}
-        return json.dumps(payload)
+        return _dumps({"type": kind, **data})
 
     def is_enabled(self) -> bool:
         return self._enabled
@@ -1,9 +1,6 @@
+import asyncio
 import json
-import threading
-import time
-from typing import Optional
-
-from websocket import create_connection, WebSocket
+from typing import Callable, Optional
 
 from kairos_core.config import get_settings
 
@@ -12,7 +9,8 @@ class ProPresenterClient:
     """ProPresenter 7 Remote WebSocket client (basic subset).
 
     Notes:
-    - Connects to ws://{host}:{port}/remote
+    - Connects to ws://{host}:{port}/remote over a persistent asyncio
+      WebSocket; actions are sent on the event loop with no thread offload
     - Authenticates with password if set
     - Sends simple control actions (best-effort; exact action names may vary by version)
     - Provides basic retry on send if connection dropped
@@ -20,11 +18,24 @@ class ProPresenterClient:
 
     def __init__(self) -> None:
         self.settings = get_settings()
-        self._ws: Optional[WebSocket] = None
-        self._lock = threading.Lock()
+        self._ws = None
+        self._lock = asyncio.Lock()
         self._connected = False
         self._last_error: Optional[str] = None
         self._protocol = "701"  # API protocol version; adjust if needed per PP version
+        # Invoked with the new status() dict whenever connected/last_error
+        # change, so consumers can push updates instead of polling.
+        self.on_status_change: Optional[Callable[[dict], None]] = None
+
+    def _set_state(self, connected: bool, error: Optional[str]) -> None:
+        changed = connected != self._connected or error != self._last_error
+        self._connected = connected
+        self._last_error = error
+        if changed and self.on_status_change is not None:
+            try:
+                self.on_status_change(self.status())
+            except Exception:
+                pass
 
     # ------------- public -------------
     def status(self) -> dict:
@@ -65,11 +76,22 @@ class ProPresenterClient:
     async def play_pause_media(self) -> bool:
         return await self._send_action({"action": "mediaPlayPause"})
 
+    async def close(self) -> None:
+        if self._ws is not None:
+            try:
+                await self._ws.close()
+            except Exception:
+                pass
+        self._ws = None
+        self._set_state(False, None)
+
     # ------------- internals -------------
-    def _connect_blocking(self) -> None:
+    async def _connect(self) -> None:
+        import websockets  # deferred; only needed when PP control is used
+
         url = f"ws://{self.settings.propresenter_host}:{self.settings.propresenter_port}/remote"
         try:
-            ws = create_connection(url, timeout=3)
+            ws = await asyncio.wait_for(websockets.connect(url), timeout=3)
             # Authenticate (password may be empty)
             auth_msg = {
                 "action": "authenticate",
@@ -78,60 +100,47 @@ class ProPresenterClient:
                 "deviceName": "Kairos",
                 "application": "remote",
             }
-            ws.send(json.dumps(auth_msg))
-            # Consume one or two initial frames if any (non-blocking)
-            ws.settimeout(0.2)
+            await ws.send(json.dumps(auth_msg))
+            # Consume one initial frame if any, without waiting long
             try:
-                _ = ws.recv()
+                await asyncio.wait_for(ws.recv(), timeout=0.2)
             except Exception:
                 pass
             self._ws = ws
-            self._connected = True
-            self._last_error = None
+            self._set_state(True, None)
         except Exception as e:
-            self._connected = False
             self._ws = None
-            self._last_error = str(e)
+            self._set_state(False, str(e))
 
-    def _ensure_connected(self) -> bool:
+    async def _ensure_connected(self) -> bool:
         if self._connected and self._ws is not None:
             return True
-        with self._lock:
+        async with self._lock:
             if self._connected and self._ws is not None:
                 return True
-            self._connect_blocking()
+            await self._connect()
             return self._connected
 
     async def _send_action(self, payload: dict) -> bool:
-        # Run sync send in a thread to avoid blocking event loop
-        import asyncio
-
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._send_action_sync, payload)
-
-    def _send_action_sync(self, payload: dict) -> bool:
         try:
-            if not self._ensure_connected():
+            if not await self._ensure_connected():
                 return False
             assert self._ws is not None
-            self._ws.send(json.dumps(payload))
+            await self._ws.send(json.dumps(payload))
             # Optional: wait briefly for ack without blocking too long
-            self._ws.settimeout(0.2)
             try:
-                _ = self._ws.recv()
+                await asyncio.wait_for(self._ws.recv(), timeout=0.2)
             except Exception:
                 pass
             return True
         except Exception as e:
             # Try one reconnect + resend
-            self._connected = False
-            self._last_error = str(e)
+            self._set_state(False, str(e))
             try:
-                self._connect_blocking()
+                await self._connect()
                 if self._connected and self._ws is not None:
-                    self._ws.send(json.dumps(payload))
+                    await self._ws.send(json.dumps(payload))
                     return True
             except Exception as e2:
-                self._connected = False
-                self._last_error = str(e2)
+                self._set_state(False, str(e2))
             return False
@@ -1,31 +1,48 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Optional
+import functools
+import queue
+from typing import AsyncIterable, Optional
 
-from google.cloud import speech_v1p1beta1 as speech
+from kairos_core.stt.interfaces import STTClient, STTResult
 
 
-MIME_TO_ENCODING = {
-    "audio/webm": speech.RecognitionConfig.AudioEncoding.WEBM_OPUS,
-    "audio/ogg": speech.RecognitionConfig.AudioEncoding.OGG_OPUS,
-    "audio/ogg;codecs=opus": speech.RecognitionConfig.AudioEncoding.OGG_OPUS,
-    "audio/wav": speech.RecognitionConfig.AudioEncoding.LINEAR16,
-    "audio/x-wav": speech.RecognitionConfig.AudioEncoding.LINEAR16,
-    "audio/l16": speech.RecognitionConfig.AudioEncoding.LINEAR16,
-}
+@functools.lru_cache(maxsize=1)
+def _speech():
+    # Deferred: the speech SDK drags in grpc + proto codegen at import time,
+    # which deployments without Google STT configured should not pay.
+    from google.cloud import speech_v1p1beta1 as speech
 
+    return speech
 
-class GoogleSpeech:
+
+@functools.lru_cache(maxsize=1)
+def _mime_to_encoding() -> dict:
+    speech = _speech()
+    return {
+        "audio/webm": speech.RecognitionConfig.AudioEncoding.WEBM_OPUS,
+        "audio/ogg": speech.RecognitionConfig.AudioEncoding.OGG_OPUS,
+        "audio/ogg;codecs=opus": speech.RecognitionConfig.AudioEncoding.OGG_OPUS,
+        "audio/wav": speech.RecognitionConfig.AudioEncoding.LINEAR16,
+        "audio/x-wav": speech.RecognitionConfig.AudioEncoding.LINEAR16,
+        "audio/l16": speech.RecognitionConfig.AudioEncoding.LINEAR16,
+    }
+
+
+class GoogleSpeech(STTClient):
     def __init__(self, language_code: str = "en-US") -> None:
-        self.client = speech.SpeechClient()
+        # The SpeechClient (and its gRPC channel) lives for the process;
+        # per-call recognize/streaming calls reuse the warm channel.
+        self.client = _speech().SpeechClient()
         self.language = language_code
 
     async def recognize_bytes(self, audio_bytes: bytes, mime_type: str) -> str:
-        return await asyncio.get_event_loop().run_in_executor(None, self._recognize_sync, audio_bytes, mime_type)
+        return await asyncio.to_thread(self._recognize_sync, audio_bytes, mime_type)
 
     def _recognize_sync(self, audio_bytes: bytes, mime_type: str) -> str:
-        encoding = MIME_TO_ENCODING.get(mime_type, speech.RecognitionConfig.AudioEncoding.ENCODING_UNSPECIFIED)
+        speech = _speech()
+        encoding = _mime_to_encoding().get(mime_type, speech.RecognitionConfig.AudioEncoding.ENCODING_UNSPECIFIED)
         audio = speech.RecognitionAudio(content=audio_bytes)
         config = speech.RecognitionConfig(
             encoding=encoding,
@@ -38,3 +55,61 @@ class GoogleSpeech:
         texts = [alt.transcript for res in response.results for alt in res.alternatives if alt.transcript]
         return texts[0] if texts else ""
 
+    async def stream_recognize(self, pcm_iter: AsyncIterable[bytes], sample_rate: int = 16000) -> AsyncIterable[STTResult]:
+        """Stream LINEAR16 PCM chunks and yield interim/final results.
+
+        The blocking StreamingRecognize call runs on one worker thread for
+        the whole utterance; chunks and responses cross the loop/thread
+        boundary through queues, so results surface as Google emits them
+        instead of after the full clip is uploaded.
+        """
+        speech = _speech()
+        streaming_config = speech.StreamingRecognitionConfig(
+            config=speech.RecognitionConfig(
+                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                sample_rate_hertz=sample_rate,
+                language_code=self.language,
+                enable_automatic_punctuation=True,
+            ),
+            interim_results=True,
+        )
+
+        loop = asyncio.get_running_loop()
+        chunk_q: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        result_q: asyncio.Queue = asyncio.Queue()
+
+        async def _feed() -> None:
+            try:
+                async for chunk in pcm_iter:
+                    chunk_q.put(chunk)
+            finally:
+                chunk_q.put(None)
+
+        def _requests():
+            while True:
+                chunk = chunk_q.get()
+                if chunk is None:
+                    return
+                yield speech.StreamingRecognizeRequest(audio_content=chunk)
+
+        def _pump() -> None:
+            try:
+                for resp in self.client.streaming_recognize(config=streaming_config, requests=_requests()):
+                    loop.call_soon_threadsafe(result_q.put_nowait, resp)
+            finally:
+                loop.call_soon_threadsafe(result_q.put_nowait, None)
+
+        feeder = asyncio.create_task(_feed())
+        pump = loop.run_in_executor(None, _pump)
+        try:
+            while (resp := await result_q.get()) is not None:
+                for result in resp.results:
+                    if result.alternatives:
+                        yield STTResult(
+                            text=result.alternatives[0].transcript,
+                            is_final=result.is_final,
+                            stability=getattr(result, "stability", None),
+                        )
+        finally:
+            await feeder
+            await pump
@@ -3,6 +3,8 @@ from typing import AsyncIterable
 
 
 class STTResult:
+    __slots__ = ("text", "is_final", "stability")
+
     def __init__(self, text: str, is_final: bool, stability: float | None = None):
         self.text = text
         self.is_final = is_final
@@ -0,0 +1,8 @@
+from fastapi.templating import Jinja2Templates
+
+# One Jinja environment for the whole app. Each Jinja2Templates instance
+# owns its own compiled-template cache, so per-router instances recompile
+# the same files; sharing one keeps every template compiled exactly once.
+templates = Jinja2Templates(directory="backend/templates")
+# Templates only change on deploy; skip the per-render mtime stat.
+templates.env.auto_reload = False
@@ -1,40 +1,99 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request, Depends
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from typing import List, Callable, Optional
+from typing import Callable, Dict, List, Optional
 import asyncio
+import base64
+import json
 import os
 
+try:
+    import orjson
+
+    def _dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _dumps_str(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - fallback when orjson is absent
+    def _dumps_bytes(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _dumps_str = json.dumps
+    _loads = json.loads
+
+from kairos_core.logging import configure_logging
 from kairos_core.orchestrator.pipeline import Orchestrator, Intent
-from kairos_core.content.db import get_db, init_db
+from kairos_core.content.db import db_connection, get_db, init_db
 from kairos_core.propresenter.client import ProPresenterClient
 from kairos_core.nlu.factory import get_nlu_client
 from kairos_core.music_id.acrcloud import ACRCloudClient
 from kairos_core.stt.google_speech import GoogleSpeech
+from kairos_core.templating import templates
 
 
 class ConnectionManager:
+    """Tracks HITL WebSocket clients.
+
+    Each connection has an outbound queue drained by a writer task. The
+    writer coalesces whatever accumulated since the last send into one
+    {"type": "multi", "payload": [...]} frame, so a heartbeat tick landing
+    together with a burst of HITL events costs each client one WebSocket
+    frame instead of one per event. The client unwraps "multi" frames.
+    """
+
+    # Per-connection buffer cap: a client that stops reading costs at most
+    # this many queued events, with the oldest dropped first. The awaited
+    # send_text of old had backpressure for free; with queues it has to be
+    # explicit or a wedged-but-connected socket leaks memory indefinitely.
+    QUEUE_MAX = 256
+
     def __init__(self) -> None:
-        self.active: List[WebSocket] = []
+        # ws -> (outbound queue, writer task): O(1) add/remove, and one
+        # lookup covers both pieces of per-connection state on disconnect.
+        self.active: Dict[WebSocket, tuple] = {}
 
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
-        self.active.append(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_MAX)
+        writer = asyncio.create_task(self._writer(websocket, queue))
+        self.active[websocket] = (queue, writer)
 
     def disconnect(self, websocket: WebSocket) -> None:
-        if websocket in self.active:
-            self.active.remove(websocket)
+        entry = self.active.pop(websocket, None)
+        if entry is not None:
+            entry[1].cancel()
 
     async def broadcast(self, message: str) -> None:
-        dead: List[WebSocket] = []
-        for ws in self.active:
-            try:
-                await ws.send_text(message)
-            except Exception:
-                dead.append(ws)
-        for ws in dead:
-            self.disconnect(ws)
+        for queue, _ in list(self.active.values()):
+            while True:
+                try:
+                    queue.put_nowait(message)
+                    break
+                except asyncio.QueueFull:
+                    # Drop-oldest: stale status frames are worthless once
+                    # newer ones exist, and the send must never block the
+                    # broadcaster on one wedged client.
+                    try:
+                        queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue) -> None:
+        try:
+            while True:
+                messages = [await queue.get()]
+                while not queue.empty():
+                    messages.append(queue.get_nowait())
+                # Encode once and ship the frame as bytes; send_text would
+                # redo the UTF-8 encode inside Starlette on every send.
+                await websocket.send_bytes(_dumps_bytes({"type": "multi", "payload": messages}))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.disconnect(websocket)
 
 
 # Load .env if present (non-fatal)
@@ -44,35 +103,94 @@ try:
 except Exception:
     pass
 
+# Prefer uvloop when available: everything here (WS fan-out, heartbeat,
+# STT/ACR HTTP) is loop-bound I/O and benefits across the board.
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
 app = FastAPI(title="Kairos Backend")
-templates = Jinja2Templates(directory="backend/templates")
 manager = ConnectionManager()
 
+# asyncio holds only weak refs to tasks; anything fire-and-forget must be
+# anchored here or the GC may cancel it mid-flight.
+_BG_TASKS: set = set()
 
-def make_event_sink() -> Callable[[str], None]:
-    loop = asyncio.get_event_loop()
 
+def _spawn(coro) -> "asyncio.Task":
+    task = asyncio.create_task(coro)
+    _BG_TASKS.add(task)
+    task.add_done_callback(_BG_TASKS.discard)
+    return task
+
+
+# With uvicorn --workers N each process has its own ConnectionManager, so
+# events raised on one worker would never reach sockets on another. When
+# KAIROS_BROADCAST_URL is set (e.g. redis://localhost:6379), events are
+# published through Redis and every worker relays them to its local
+# clients; unset, publishing degrades to the in-process manager.
+BROADCAST_URL = os.getenv("KAIROS_BROADCAST_URL")
+app.state.broadcast = None
+
+
+async def _publish(msg: str) -> None:
+    if app.state.broadcast is not None:
+        await app.state.broadcast.publish(channel="hitl", message=msg)
+    else:
+        await manager.broadcast(msg)
+
+
+def make_event_sink() -> Callable[[str], None]:
     def _sink(msg: str) -> None:
-        loop.create_task(manager.broadcast(msg))
+        # Sinks always fire from coroutine context; use the running loop at
+        # call time rather than a loop captured at import, which is both
+        # deprecated and stale after a reload.
+        _spawn(_publish(msg))
 
     return _sink
 
 
 @app.on_event("startup")
 async def on_startup() -> None:
+    configure_logging()
     init_db()
-    # Background heartbeat to push ProPresenter status to HITL
+
+    if BROADCAST_URL:
+        from broadcaster import Broadcast
+
+        app.state.broadcast = Broadcast(BROADCAST_URL)
+        await app.state.broadcast.connect()
+
+        async def relay():
+            async with app.state.broadcast.subscribe(channel="hitl") as sub:
+                async for event in sub:
+                    await manager.broadcast(event.message)
+
+        _spawn(relay())
+
+    # Status transitions push to HITL immediately; the heartbeat below is
+    # only a slow diff-checked keepalive instead of a 2s blind poll.
+    def push_status(status: dict) -> None:
+        _spawn(manager.broadcast(_dumps_str({"type": "pp_status", **status})))
+
+    prop_client.on_status_change = push_status
+
     async def heartbeat():
-        import json
+        last: Optional[dict] = None
         while True:
             try:
                 status = prop_client.status()
-                await manager.broadcast(json.dumps({"type": "pp_status", **status}))
+                if status != last:
+                    await manager.broadcast(_dumps_str({"type": "pp_status", **status}))
+                    last = status
             except Exception:
                 pass
-            await asyncio.sleep(2)
+            await asyncio.sleep(10)
 
-    asyncio.create_task(heartbeat())
+    _spawn(heartbeat())
 
 
 # Mount static directory (optional for simple JS)
@@ -106,23 +224,25 @@ async def hitl(request: Request):
 @app.websocket("/ws/hitl")
 async def ws_hitl(websocket: WebSocket):
     await manager.connect(websocket)
+    json_loads = _loads  # bound once, outside the per-message loop
     try:
         while True:
             msg = await websocket.receive_text()
-            # Expect JSON messages for confirm/cancel
+            # Expect JSON messages for confirm/cancel. Only a failed decode
+            # is ignorable; the old bare except also swallowed disconnects
+            # until they resurfaced from the next receive.
             try:
-                import json
-
-                data = json.loads(msg)
-                if isinstance(data, dict):
-                    typ = data.get("type")
-                    if typ == "confirm" and data.get("id"):
-                        await orchestrator.confirm_pending(data["id"], next(get_db()))
-                    elif typ == "cancel" and data.get("id"):
-                        orchestrator.cancel_pending(data["id"])
-            except Exception:
-                # ignore malformed inputs
-                pass
+                data = json_loads(msg)
+            except ValueError:
+                continue
+            if not isinstance(data, dict):
+                continue
+            typ = data.get("type")
+            if typ == "confirm" and data.get("id"):
+                with db_connection() as db:
+                    await orchestrator.confirm_pending(data["id"], db)
+            elif typ == "cancel" and data.get("id"):
+                orchestrator.cancel_pending(data["id"])
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
@@ -176,10 +296,10 @@ async def api_music_identify(payload: dict, db=Depends(get_db)):
     """
     audio_b64 = (payload or {}).get("audio_base64")
     if audio_b64 and acr_client:
-        import base64
-
         try:
-            audio_bytes = base64.b64decode(audio_b64)
+            # Multi-MB clips: a pure-CPU decode on the loop would stall
+            # every broadcast for its duration.
+            audio_bytes = await asyncio.to_thread(base64.b64decode, audio_b64)
         except Exception:
             return {"status": "error", "message": "invalid base64"}
         res = await acr_client.identify(audio_bytes)
@@ -207,10 +327,8 @@ async def api_stt_recognize(payload: dict, db=Depends(get_db)):
     mime = (payload or {}).get("mime") or "audio/webm"
     if not b64:
         return {"status": "error", "message": "audio_base64 required"}
-    import base64
-
     try:
-        audio_bytes = base64.b64decode(b64)
+        audio_bytes = await asyncio.to_thread(base64.b64decode, b64)
     except Exception:
         return {"status": "error", "message": "invalid base64"}
     text = await stt_client.recognize_bytes(audio_bytes, mime)
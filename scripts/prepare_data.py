@@ -1,4 +1,6 @@
 import os
+from multiprocessing import Pool
+
 import pandas as pd
 from sklearn.model_selection import train_test_split
 
@@ -6,21 +8,22 @@ def prepare_data(raw_data_dir, processed_data_dir):
     # Ensure the processed data directory exists
     os.makedirs(processed_data_dir, exist_ok=True)
 
-    # Load raw audio data (assuming they are in a specific format)
-    raw_files = [f for f in os.listdir(raw_data_dir) if f.endswith('.wav')]
-    
-    # Process each raw audio file
-    for file in raw_files:
-        # Here you would add your audio processing logic
-        # For example, loading the audio file, normalizing, etc.
-        audio_path = os.path.join(raw_data_dir, file)
-        
-        # Placeholder for audio processing
-        processed_audio = process_audio(audio_path)
-        
-        # Save the processed audio to the processed data directory
-        processed_audio_path = os.path.join(processed_data_dir, file)
-        save_processed_audio(processed_audio, processed_audio_path)
+    # Load raw audio data (assuming they are in a specific format).
+    # scandir streams entries and carries the full path, so there is no
+    # per-file os.path.join and no extra stat() on network filesystems.
+    with os.scandir(raw_data_dir) as it:
+        entries = [(e.name, e.path) for e in it if e.is_file() and e.name.endswith('.wav')]
+    raw_files = [name for name, _ in entries]
+    audio_paths = [path for _, path in entries]
+
+    # Decode/resample/normalize is CPU-bound and independent per file;
+    # a process pool uses every core instead of one.
+    with Pool() as pool:
+        processed = pool.map(process_audio, audio_paths)
+
+    # Save the processed audio to the processed data directory
+    for file, processed_audio in zip(raw_files, processed):
+        save_processed_audio(processed_audio, os.path.join(processed_data_dir, file))
 
 def process_audio(audio_path):
     # Placeholder function for audio processing
@@ -1 +1,5 @@
-# This file initializes the Kairos package.
\ No newline at end of file
+# This file initializes the Kairos package.
+
+from kairos.core import Kairos
+
+__all__ = ["Kairos"]
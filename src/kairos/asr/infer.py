@@ -5,21 +5,41 @@ import torchaudio
 
 class ASRModel:
     def __init__(self, model_path):
+        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self.model = self.load_model(model_path)
 
     def load_model(self, model_path):
-        model = torch.load(model_path)
-        model.eval()
+        # Prefer TorchScript checkpoints: the scripted forward runs with op
+        # fusion and no Python in the hot path. Eager torch.load remains the
+        # fallback for older pickled checkpoints.
+        # Reduced precision keeps matmuls on Tensor Cores (fp16 on GPU) or
+        # AVX512-BF16 (bf16 on CPU); ASR inference tolerates it fine. The
+        # cast must land before optimize_for_inference: freezing inlines
+        # the parameters as graph constants, after which they can no
+        # longer be retyped and parameters() comes back empty.
+        self.dtype = torch.float16 if self.device.type == "cuda" else torch.bfloat16
+        try:
+            model = torch.jit.load(model_path, map_location=self.device)
+            model.eval()
+            model = model.to(self.dtype)
+            model = torch.jit.optimize_for_inference(model)
+        except RuntimeError:
+            model = torch.load(model_path, map_location=self.device)
+            model.eval()
+            model = model.to(self.dtype)
         return model
 
     def preprocess_audio(self, audio_path):
         waveform, sample_rate = torchaudio.load(audio_path)
-        # Add any necessary preprocessing steps here
-        return waveform
+        # Move in one step to the model's device/dtype; non_blocking lets
+        # the H2D copy overlap with decode of the next file.
+        return waveform.to(self.device, dtype=self.dtype, non_blocking=True)
 
     def infer(self, audio_path):
         waveform = self.preprocess_audio(audio_path)
-        with torch.no_grad():
+        # inference_mode is no_grad minus the autograd version-counter
+        # bookkeeping on every tensor touched.
+        with torch.inference_mode():
             output = self.model(waveform)
         return output
 
@@ -36,4 +56,4 @@ if __name__ == "__main__":
     parser.add_argument("model_path", type=str, help="Path to the ASR model.")
     args = parser.parse_args()
 
-    main(args.audio_path, args.model_path)
\ No newline at end of file
+    main(args.audio_path, args.model_path)
@@ -1,29 +1,131 @@
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from kairos.logging import get_logger
+
+# Engine names _ensure_recognizer builds dispatch entries for, exposed so
+# callers (and tests) can validate a configured name without importing
+# speech_recognition.
+ENGINES = ("google", "sphinx", "google_cloud", "whisper", "wit")
+
+# "baseline" is the legacy name shipped in older configs (and still in
+# configs/default.yaml); it has always meant the default engine.
+_ENGINE_ALIASES = {"baseline": "google"}
+
+
 class ASRModel:
-    def __init__(self, model_name: str = "baseline", input_shape=None):
-        self.model_name = model_name
+    def __init__(self, model_name: str = "google", input_shape=None, language: str = "en-US",
+                 calibrate: bool = False):
+        self.model_name = _ENGINE_ALIASES.get(model_name, model_name)
         self.input_shape = input_shape
+        self.language = language
+        # Ambient-noise calibration burns 0.5s of audio per call; for
+        # prerecorded files the static energy_threshold is enough, so it is
+        # opt-in and runs at most once per model.
+        self.calibrate = calibrate
+        self._calibrated = False
+        self.log = get_logger("kairos.asr.model")
+        self._sr = None
+        self.recognizer = None
+        self._dispatch = None
         self.model = self.build_model()
 
     def build_model(self):
-        # Define the architecture of the ASR model here
-        pass
+        # speech_recognition is imported lazily (like PyAudio in the
+        # recorder) so constructing the model never requires it; the
+        # recognizer and dispatch table are built on first use.
+        return self.recognizer
+
+    def _ensure_recognizer(self):
+        if self.recognizer is None:
+            try:
+                import speech_recognition as sr  # type: ignore
+            except Exception as e:  # noqa: BLE001
+                raise RuntimeError("speech_recognition is required for ASR but is not installed") from e
+            self._sr = sr
+            self.recognizer = sr.Recognizer()
+            # Static threshold suits prerecorded files; live input
+            # recalibrates in predict.
+            self.recognizer.energy_threshold = 300
+            # Engine dispatch built once: methods are bound and
+            # keys/credentials read from the environment here, not on every
+            # predict call.
+            self._dispatch = {
+                "google": functools.partial(self.recognizer.recognize_google, language=self.language),
+                "sphinx": self.recognizer.recognize_sphinx,
+                "google_cloud": functools.partial(
+                    self.recognizer.recognize_google_cloud,
+                    credentials_json=os.getenv("GOOGLE_APPLICATION_CREDENTIALS"),
+                    language=self.language,
+                ),
+                "whisper": functools.partial(
+                    self.recognizer.recognize_whisper,
+                    language=self.language.split("-")[0],
+                ),
+                "wit": functools.partial(self.recognizer.recognize_wit, key=os.getenv("WIT_AI_KEY")),
+            }
+        return self.recognizer
+
+    def _recognize_with_engine(self, audio_data):
+        try:
+            engine = self._dispatch[self.model_name]
+        except KeyError:
+            raise ValueError(f"Unknown ASR engine: {self.model_name}") from None
+        return engine(audio_data)
 
     def train(self, training_data, labels, epochs, batch_size):
-        # Implement the training logic here
+        # API-backed engines have no trainable weights; see kairos.training
+        # for the local model path.
         pass
 
     def evaluate(self, test_data, test_labels):
-        # Implement the evaluation logic here
-        pass
+        total = len(test_data)
+        # Each predict is a network round-trip to the recognizer backend;
+        # fanning out over threads turns N sequential RTTs into N/16.
+        with ThreadPoolExecutor(max_workers=16) as ex:
+            preds = list(ex.map(self.predict, test_data))
+        correct = sum(1 for p, e in zip(preds, test_labels) if p and p.lower() == e.lower())
+        accuracy = correct / total if total else 0.0
+        self.log.info("ASR accuracy: %.3f (%d/%d)", accuracy, correct, total)
+        return accuracy
 
     def predict(self, audio_input):
-        # Implement the prediction logic here
-        pass
+        self._ensure_recognizer()
+        sr = self._sr
+        with sr.AudioFile(audio_input) as source:
+            if self.calibrate and not self._calibrated:
+                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                self._calibrated = True
+            audio_data = self.recognizer.record(source)
+        try:
+            return self._recognize_with_engine(audio_data)
+        except sr.UnknownValueError:
+            return ""
+        except sr.RequestError as e:
+            self.log.error("ASR request failed: %s", e)
+            return ""
+
+    def predict_buffer(self, pcm_bytes, sample_rate, sample_width=2):
+        """Recognize raw PCM directly, without a file round-trip.
+
+        Streaming callers hand over segments as they are captured.
+        """
+        self._ensure_recognizer()
+        sr = self._sr
+        audio_data = sr.AudioData(pcm_bytes, sample_rate, sample_width)
+        try:
+            return self._recognize_with_engine(audio_data)
+        except sr.UnknownValueError:
+            return ""
+        except sr.RequestError as e:
+            self.log.error("ASR request failed: %s", e)
+            return ""
 
     def save_model(self, filepath):
-        # Implement model saving logic here
+        # Nothing to persist for API-backed engines
         pass
 
     def load_model(self, filepath):
-        # Implement model loading logic here
+        # Nothing to load for API-backed engines
         pass
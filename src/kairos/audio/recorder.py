@@ -1,13 +1,25 @@
+import os
+import queue
+import threading
+import time
 import wave
 from kairos.logging import get_logger
 
 
 class AudioRecorder:
-    def __init__(self, filename: str = "output.wav", channels=1, rate=44100, chunk=1024):
+    def __init__(self, filename: str = "output.wav", channels=1, rate=16000, chunk=1024,
+                 preallocate_seconds=0):
         self.filename = filename
         self.channels = channels
         self.rate = rate
+        # PortAudio takes arbitrary frames_per_buffer; core.py caps this
+        # at a 20 ms frame so VAD/ASR front-ends consume buffers without
+        # repacking.
         self.chunk = chunk
+        # When set, the WAV file is preallocated to this many seconds of
+        # PCM up front so the filesystem reserves contiguous space —
+        # avoids fragmentation and write stalls for hour-long takes.
+        self.preallocate_seconds = preallocate_seconds
         self._pa = None
         self.stream = None
         self.log = get_logger("kairos.audio.recorder")
@@ -15,44 +27,101 @@ class AudioRecorder:
     def _ensure_pa(self):
         if self._pa is None:
             try:
-                from pyaudio import PyAudio, paInt16  # type: ignore
+                from pyaudio import PyAudio, paInt16, paContinue  # type: ignore
             except Exception as e:  # noqa: BLE001
                 raise RuntimeError("PyAudio is required for recording but is not installed") from e
-            self._pa = (PyAudio, paInt16)
+            self._pa = (PyAudio, paInt16, paContinue)
         return self._pa
 
     def start_recording(self):
-        PyAudio, paInt16 = self._ensure_pa()
+        PyAudio, paInt16, paContinue = self._ensure_pa()
         audio = PyAudio()
+        sample_size = audio.get_sample_size(paInt16)
+
+        # Producer/consumer split: the PyAudio callback runs on the audio
+        # thread and must never block, so it only enqueues; a writer
+        # thread drains the queue into the WAV. A slow disk then costs
+        # queue depth instead of overflowing the capture buffer, and
+        # memory stays bounded (streaming write keeps an interrupted take
+        # playable).
+        frames_q: "queue.Queue[bytes | None]" = queue.Queue(maxsize=64)
+
+        def _callback(in_data, frame_count, time_info, status):
+            try:
+                frames_q.put_nowait(in_data)
+            except queue.Full:
+                # Drop this buffer rather than stall the audio thread
+                pass
+            return (None, paContinue)
+
+        wf = wave.open(self.filename, 'wb')
+        wf.setnchannels(self.channels)
+        wf.setsampwidth(sample_size)
+        wf.setframerate(self.rate)
+        if self.preallocate_seconds and hasattr(os, 'posix_fallocate'):
+            expected = self.preallocate_seconds * self.rate * self.channels * sample_size
+            try:
+                os.posix_fallocate(wf._file.fileno(), 0, expected)
+            except OSError:
+                pass  # best-effort; not every filesystem supports it
+
+        def _drain():
+            while True:
+                data = frames_q.get()
+                if data is None:
+                    break
+                # writeframesraw, not writeframes: the latter re-patches
+                # the RIFF header (seek to 0 and back) on every chunk.
+                # close() writes the final header once.
+                wf.writeframesraw(data)
+
+        writer = threading.Thread(target=_drain, daemon=True)
+        writer.start()
+
         self.stream = audio.open(
             format=paInt16,
             channels=self.channels,
             rate=self.rate,
             input=True,
             frames_per_buffer=self.chunk,
+            stream_callback=_callback,
         )
         self.log.info("Recording started")
-
-        frames = []
         try:
-            while True:
-                data = self.stream.read(self.chunk)
-                frames.append(data)
+            while self.stream.is_active():
+                time.sleep(0.1)
         except KeyboardInterrupt:
             self.log.info("Recording stopped by user")
+        finally:
+            self.stop_recording(audio=audio)
+            frames_q.put(None)  # sentinel: flush and end the writer
+            writer.join()
+            # posix_fallocate extends st_size, so a take shorter than the
+            # reservation would keep a tail of zeros past the audio data
+            # (players honor the RIFF length, but the file stays
+            # hour-sized on disk). Note the end of the written data, then
+            # cut the file back after close() — close only seeks back to
+            # patch the header, it never truncates.
+            data_end = wf._file.tell() if self.preallocate_seconds else None
+            wf.close()
+            if data_end is not None and os.path.getsize(self.filename) > data_end:
+                os.truncate(self.filename, data_end)
+        self.log.info("Recording saved to %s", self.filename)
 
-        self.stop_recording(frames, audio, paInt16)
-
-    def stop_recording(self, frames, audio=None, paInt16=None):
+    def stop_recording(self, frames=None, audio=None, paInt16=None):
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
         if audio:
             audio.terminate()
 
+        if frames is None:
+            # Streaming path: start_recording already wrote the file.
+            return
+
         if paInt16 is None:
             # Fetch sample width via fresh PyAudio if available
-            PyAudio, paInt16 = self._ensure_pa()
+            PyAudio, paInt16, _ = self._ensure_pa()
             audio = PyAudio()
             sample_size = audio.get_sample_size(paInt16)
             audio.terminate()
@@ -63,5 +132,10 @@ class AudioRecorder:
             wf.setnchannels(self.channels)
             wf.setsampwidth(sample_size)
             wf.setframerate(self.rate)
-            wf.writeframes(b''.join(frames))
+            # Write each captured chunk directly instead of memcpy-ing the
+            # whole take into one joined bytes object first;
+            # writeframesraw defers the RIFF size patch to close(), so the
+            # header is fixed up once rather than per chunk.
+            for f in frames:
+                wf.writeframesraw(f)
         self.log.info("Recording saved to %s", self.filename)
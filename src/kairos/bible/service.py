@@ -0,0 +1,147 @@
+import os
+import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from kairos.logging import get_logger
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - fallback when orjson is absent
+    import json
+
+    _loads = json.loads
+
+
+class BibleService:
+    """Fetches Bible verses from bible-api.com with a persistent cache.
+
+    Verse text is immutable, so every successful fetch is stored in a
+    small SQLite database and repeated lookups never touch the network.
+    A single requests.Session keeps the TLS connection warm between
+    uncached fetches.
+    """
+
+    API_URL = "https://bible-api.com/"
+
+    # One combined pattern compiled at class load: the verse part is
+    # optional, so "book chapter" and "book chapter:verse[-end]" match in
+    # a single attempt instead of two re.match calls per parse.
+    _REF_RE = re.compile(
+        r"^(?P<book>\d?\s*[A-Za-z]+(?:\s+[A-Za-z]+)*)\s+(?P<chap>\d+)"
+        r"(?::(?P<start>\d+)(?:-(?P<end>\d+))?)?$",
+        re.IGNORECASE,
+    )
+
+    def __init__(self, translation: str = "kjv", cache_path: str | None = None,
+                 session: requests.Session | None = None):
+        self.translation = translation
+        self.log = get_logger("kairos.bible")
+        if session is None:
+            # A mounted adapter keeps a small pool of warm TLS sockets so
+            # sequential next/previous navigation reuses one connection
+            # instead of paying a fresh handshake per verse; transient
+            # failures get two quick retries.
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(total=2, backoff_factor=0.2),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        if cache_path is None:
+            cache_path = os.path.join(os.path.expanduser("~"), ".kairos", "bible_cache.db")
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        self._cache = sqlite3.connect(cache_path, check_same_thread=False)
+        self._cache.execute(
+            "CREATE TABLE IF NOT EXISTS verses("
+            "api TEXT, translation TEXT, ref TEXT, text TEXT, "
+            "PRIMARY KEY(api, translation, ref))"
+        )
+        self._cache_lock = threading.Lock()
+        # In-memory layer above the SQLite cache: repeated navigation
+        # over the same handful of verses skips even the database hop.
+        # Built per instance (so the cache dies with the service) and
+        # keyed on (reference, translation), which makes invalidation on
+        # a translation switch automatic.
+        self._get_verse_cached = lru_cache(maxsize=256)(self._get_verse_uncached)
+
+    def parse_reference(self, reference):
+        """Parse 'John 3:16', 'John 3:16-18' or 'John 3' into (book, chapter, start, end).
+
+        Chapter-only references return (book, chapter, None, None).
+        Unparseable input returns None. Voice commands repeat the same
+        handful of references, so results are memoized; the returned
+        tuple is immutable, making the cache safe to share.
+        """
+        return self._parse_cached(reference.strip())
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_cached(ref):
+        m = BibleService._REF_RE.match(ref)
+        if not m:
+            return None
+        book, chap, start, end = m.group("book", "chap", "start", "end")
+        if start is None:
+            return book, int(chap), None, None
+        start = int(start)
+        return book, int(chap), start, int(end) if end else start
+
+    def get_verse(self, reference):
+        """Return the verse text for a reference, or None if unavailable."""
+        return self._get_verse_cached(reference.strip().lower(), self.translation)
+
+    def _get_verse_uncached(self, key, translation):
+        if self.parse_reference(key) is None:
+            self.log.warning("Unparseable Bible reference: %r", key)
+            return None
+        row = self._cache.execute(
+            "SELECT text FROM verses WHERE api=? AND translation=? AND ref=?",
+            ("bible-api.com", translation, key),
+        ).fetchone()
+        if row is not None:
+            return row[0]
+        text = self._fetch_from_bible_api_com(key, translation)
+        if text is not None:
+            with self._cache_lock:
+                self._cache.execute(
+                    "INSERT OR REPLACE INTO verses VALUES (?, ?, ?, ?)",
+                    ("bible-api.com", translation, key, text),
+                )
+                self._cache.commit()
+        return text
+
+    def get_verses(self, references, max_workers=8):
+        """Fetch many references concurrently.
+
+        Cache hits resolve locally; misses fan out over a thread pool and
+        share the Session's connection pool, so a cold batch costs about
+        one round-trip instead of N.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            return list(ex.map(self.get_verse, references))
+
+    def _fetch_from_bible_api_com(self, reference, translation):
+        url = f"{self.API_URL}{reference}?translation={translation}"
+        try:
+            response = self.session.get(url, timeout=5)
+            response.raise_for_status()
+            # Parse the raw bytes directly: skips requests' charset
+            # detection, and orjson is several times faster than the
+            # stdlib parser on chapter-sized payloads.
+            data = _loads(response.content)
+        except Exception as e:  # noqa: BLE001
+            self.log.error("Bible API request failed for %r: %s", reference, e)
+            return None
+        return (data.get("text") or "").strip() or None
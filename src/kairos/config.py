@@ -1,13 +1,58 @@
 import os
 import yaml
 
+from kairos.logging import get_logger
 
-DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "..", "configs", "default.yaml")
 
+DEFAULT_CONFIG_PATH = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "..", "configs", "default.yaml")
+)
 
-def _read_yaml(path):
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+log = get_logger("kairos.config")
+
+
+# libyaml C loader when the binding is compiled in; several times faster
+# than the pure-Python SafeLoader and parses the same documents.
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed documents keyed by (path, mtime, size): each config version is
+# parsed once and subsequent loads cost a stat instead of a full parse.
+_YAML_CACHE: dict = {}
+
+# Merged results keyed by the tuple of per-file cache keys, so repeated
+# start/stop cycles skip even the dict merge when nothing on disk moved.
+_MERGED_CACHE: dict = {}
+
+
+def _stat_key(path):
+    # One stat serves both as the existence check (no racy
+    # os.path.exists-then-open) and the cache key.
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return (path, None, None)
+    return (path, st.st_mtime, st.st_size)
+
+
+def _read_yaml(key):
+    path, mtime, _size = key
+    if mtime is None:
+        log.warning("Config file not found: %s", path)
+        return {}
+    data = _YAML_CACHE.get(key)
+    if data is None:
+        # The file can vanish between the stat and this open; treat that
+        # the same as a stat-time miss rather than letting the error out
+        # of load_config.
+        try:
+            f = open(path, "r", encoding="utf-8")
+        except FileNotFoundError:
+            log.warning("Config file not found: %s", path)
+            return {}
+        with f:
+            data = yaml.load(f, Loader=_Loader) or {}
+        _YAML_CACHE[key] = data
+    return data
 
 
 def load_config(path: str | None = None) -> dict:
@@ -18,21 +63,18 @@ def load_config(path: str | None = None) -> dict:
     - file provided by `path`
     - file provided by env var `KAIROS_CONFIG`
     """
-    config = {}
-    default_path = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", "configs", "default.yaml"))
-    if os.path.exists(default_path):
-        config.update(_read_yaml(default_path))
-
-    paths = []
-    if path:
-        paths.append(path)
-    env_path = os.getenv("KAIROS_CONFIG")
-    if env_path:
-        paths.append(env_path)
-
-    for p in paths:
-        if os.path.exists(p):
-            config.update(_read_yaml(p))
-
-    return config
+    paths = [DEFAULT_CONFIG_PATH]
+    for p in (path, os.getenv("KAIROS_CONFIG")):
+        if p:
+            paths.append(os.path.abspath(p))
+    keys = tuple(_stat_key(p) for p in paths)
+    merged = _MERGED_CACHE.get(keys)
+    if merged is None:
+        merged = {}
+        for key in keys:
+            merged.update(_read_yaml(key))
+        _MERGED_CACHE[keys] = merged
+    # Callers may mutate their config; hand out a copy so the cache stays
+    # pristine.
+    return dict(merged)
 
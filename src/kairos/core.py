@@ -1,44 +1,100 @@
 # core.py
 
+import logging
+import os
+import queue
+import tempfile
+import threading
+import time
+import wave
+from functools import cached_property
+
 from kairos.config import load_config
 from kairos.logging import get_logger
 
 
 class Kairos:
     def __init__(self):
-        self.audio_recorder = None
-        self.asr_model = None
-        self.nlp_processor = None
-        self.presentation_controller = None
         self._running = False
         self.config = {}
         self.log = get_logger("kairos.core")
+        # Cached level check for the per-command hot path: a disabled
+        # info log then costs one attribute load instead of a LogRecord
+        # build and handler walk. Refreshed in start() in case a config
+        # reload changes the level.
+        self._log_info_on = self.log.isEnabledFor(logging.INFO)
+        self.current_bible_reference = None
+        self.current_bible_parsed = None
+        # O(1) dispatch for the Bible intents; anything not in this table
+        # falls through to the presentation controller.
+        self._bible_handlers = {
+            "show_bible_verse": lambda params: self.show_bible_verse(params.get("reference")),
+            "set_bible_translation": lambda params: self.set_bible_translation(params.get("translation")),
+            "next_verse": lambda params: self.next_bible_verse(),
+            "previous_verse": lambda params: self.previous_bible_verse(),
+        }
 
-    def initialize_components(self):
+    # Components are cached_property so each heavy import (torch via the
+    # ASR stack, PyAudio, the NLP layer) happens on first use rather than
+    # in one synchronous burst at start(); `kairos --status`/`--stop`
+    # never touch any of them.
+
+    @cached_property
+    def audio_recorder(self):
         from kairos.audio.recorder import AudioRecorder
-        from kairos.asr.model import ASRModel
-        from kairos.nlp.intent import IntentProcessor
-        from kairos.presentation.controller import PresentationController
-        from kairos.presentation.http_client import HTTPPresentationClient
-        from kairos.presentation.client_base import PresentationAPIClient
 
         audio_cfg = self.config.get("audio", {})
-        asr_cfg = self.config.get("asr", {})
-
-        self.audio_recorder = AudioRecorder(
+        # 16 kHz is the native rate of the ASR stack; see default.yaml
+        # for the playback-quality tradeoff.
+        rate = audio_cfg.get("rate", 16000)
+        # Cap the chunk at a 20 ms frame (floor 128 frames): 20 ms is
+        # what VAD and streaming ASR front-ends frame on, so they consume
+        # buffers without repacking, and smaller buffers cut first-sample
+        # latency. PortAudio accepts arbitrary frames_per_buffer, so the
+        # cap lands exactly on rate // 50 (320 frames at 16 kHz).
+        cap = max(128, rate // 50)
+        return AudioRecorder(
             filename=audio_cfg.get("filename", "output.wav"),
             channels=audio_cfg.get("channels", 1),
-            rate=audio_cfg.get("rate", 44100),
-            chunk=audio_cfg.get("chunk", 1024),
+            rate=rate,
+            chunk=min(audio_cfg.get("chunk", 1024), cap),
         )
-        self.asr_model = ASRModel(model_name=asr_cfg.get("model_name", "baseline"))
-        self.nlp_processor = IntentProcessor()
 
-        # Build presentation client based on config
+    @cached_property
+    def asr_model(self):
+        from kairos.asr.model import ASRModel
+
+        return ASRModel(model_name=self.config.get("asr", {}).get("model_name", "baseline"))
+
+    @cached_property
+    def bible_service(self):
+        from kairos.bible.service import BibleService
+
+        bible_cfg = self.config.get("bible", {})
+        return BibleService(translation=bible_cfg.get("translation", "kjv"))
+
+    @cached_property
+    def nlp_processor(self):
+        from kairos.nlp.intent import IntentProcessor
+
+        nlp_cfg = self.config.get("nlp", {})
+        provider_id = nlp_cfg.get("provider")
+        provider = None
+        if provider_id and provider_id not in ("rules", "rule_based"):
+            from kairos.nlp.provider_factory import create_provider
+
+            provider = create_provider(provider_id, nlp_cfg.get("options", {}))
+        return IntentProcessor(provider=provider)
+
+    @cached_property
+    def presentation_controller(self):
+        from kairos.presentation.controller import PresentationController
+        from kairos.presentation.http_client import HTTPPresentationClient
+        from kairos.presentation.client_base import PresentationAPIClient
+
         pres_cfg = self.config.get("presentation", {})
-        client_type = pres_cfg.get("client", "stub")
         client: PresentationAPIClient | None = None
-        if client_type == "http":
+        if pres_cfg.get("client", "stub") == "http":
             http_cfg = pres_cfg.get("http", {})
             client = HTTPPresentationClient(
                 base_url=http_cfg.get("base_url", "http://127.0.0.1:50001"),
@@ -47,7 +103,15 @@ class Kairos:
                 timeout=float(http_cfg.get("timeout", 2.0)),
             )
 
-        self.presentation_controller = PresentationController(api_client=client)
+        return PresentationController(api_client=client)
+
+    def initialize_components(self):
+        # Force-construct every lazy component (e.g. to fail fast on
+        # missing hardware); normal paths build each on first access.
+        self.audio_recorder
+        self.asr_model
+        self.nlp_processor
+        self.presentation_controller
 
     def run(self):
         # Backwards-compatible entry point
@@ -55,19 +119,266 @@ class Kairos:
         print("Kairos system is running. Awaiting voice commands...")
 
     def process_command(self, command):
-        self.log.info("Processing command: %s", command)
+        if self._log_info_on:
+            self.log.info("Processing command: %s", command)
         intent_tuple = self.nlp_processor.recognize_intent(command)
+        return self._dispatch_intent(intent_tuple)
+
+    def _dispatch_intent(self, intent_tuple):
+        if intent_tuple is not None:
+            handler = self._bible_handlers.get(intent_tuple[0])
+            if handler is not None:
+                return handler(intent_tuple[1])
         return self.presentation_controller.execute_intent(intent_tuple)
 
+    def process_commands(self, commands):
+        """Process a batch of commands with one NLP call.
+
+        Recognition goes through recognize_intents so a model-backed
+        processor can batch its forward pass; execution stays serialized
+        since presentation actions are ordered.
+        """
+        if self._log_info_on:
+            self.log.info("Processing %d commands", len(commands))
+        intents = self.nlp_processor.recognize_intents(commands)
+        return [self._dispatch_intent(i) for i in intents]
+
+    def show_bible_verse(self, reference):
+        """Fetch and display a verse; remembers it for next/previous navigation."""
+        if not reference:
+            return None
+        text = self.bible_service.get_verse(reference)
+        if text is None:
+            return None
+        self.current_bible_reference = reference
+        # Parsed once here so next/previous navigation is pure arithmetic.
+        self.current_bible_parsed = self.bible_service.parse_reference(reference)
+        if self._log_info_on:
+            self.log.info("Showing %s: %s", reference, text)
+        return text
+
+    def set_bible_translation(self, translation):
+        if not translation:
+            return None
+        self.bible_service.translation = translation
+        if self._log_info_on:
+            self.log.info("Bible translation set to %s", translation)
+        return translation
+
+    def next_bible_verse(self):
+        return self._step_bible_verse(1)
+
+    def previous_bible_verse(self):
+        return self._step_bible_verse(-1)
+
+    def _step_bible_verse(self, delta):
+        parsed = self.current_bible_parsed
+        if parsed is None:
+            return None
+        book, chap, start, _end = parsed
+        verse = (start or 1) + delta
+        if verse < 1:
+            return None
+        reference = f"{book} {chap}:{verse}"
+        text = self.bible_service.get_verse(reference)
+        if text is None:
+            return None
+        self.current_bible_reference = reference
+        # The stepped tuple is known without going back through the
+        # reference parser.
+        self.current_bible_parsed = (book, chap, verse, verse)
+        if self._log_info_on:
+            self.log.info("Showing %s: %s", reference, text)
+        return text
+
+    def process_audio_file(self, audio_path):
+        """Transcribe a WAV file and execute the resulting command."""
+        if self._log_info_on:
+            self.log.info("Processing audio file: %s", audio_path)
+        text = self.asr_model.predict(audio_path)
+        if not text:
+            self.log.info("No speech recognized in %s", audio_path)
+            return None
+        return self.process_command(text)
+
+    def process_voice_command_interactive(self, duration=5):
+        """Record from the microphone for ``duration`` seconds, then transcribe and execute.
+
+        PyAudio stays a call-site import inside the worker thread so a
+        missing audio stack degrades this path without breaking Kairos
+        construction; everything else is imported once at module top.
+
+        Capture runs in PortAudio callback mode (same split as
+        AudioRecorder.start_recording): the driver thread only enqueues
+        buffers, keeping Python out of the per-chunk critical path, and
+        the worker drains the queue straight into the temp WAV, so peak
+        memory stays one chunk and there is no buffer-then-serialize
+        pass or cross-file move afterwards.
+        """
+        recorder = self.audio_recorder
+        # The tempfile lands under TMPDIR — tmpfs on typical Linux — and
+        # capture writes go straight there, so a 5 s take never touches a
+        # spinning disk and there is no cross-filesystem move afterwards.
+        temp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
+        temp_audio_path = temp.name
+        temp.close()
+        done = threading.Event()
+        recorded = threading.Event()
+
+        def record_for_duration():
+            try:
+                from pyaudio import PyAudio, paInt16, paContinue  # type: ignore
+            except Exception:  # noqa: BLE001
+                self.log.error("PyAudio is required for interactive voice commands")
+                done.set()
+                return
+            audio = PyAudio()
+            wf = wave.open(temp_audio_path, "wb")
+            wf.setnchannels(recorder.channels)
+            wf.setsampwidth(audio.get_sample_size(paInt16))
+            wf.setframerate(recorder.rate)
+            frames_q: "queue.Queue[bytes]" = queue.Queue(maxsize=64)
+
+            def _callback(in_data, frame_count, time_info, status):
+                try:
+                    frames_q.put_nowait(in_data)
+                except queue.Full:
+                    pass  # drop rather than stall the audio thread
+                return (None, paContinue)
+
+            stream = audio.open(
+                format=paInt16,
+                channels=recorder.channels,
+                rate=recorder.rate,
+                input=True,
+                frames_per_buffer=recorder.chunk,
+                stream_callback=_callback,
+            )
+            deadline = time.monotonic() + duration
+            try:
+                while time.monotonic() < deadline:
+                    try:
+                        wf.writeframesraw(frames_q.get(timeout=0.1))
+                    except queue.Empty:
+                        pass
+                stream.stop_stream()
+                while True:  # flush whatever the callback enqueued last
+                    try:
+                        wf.writeframesraw(frames_q.get_nowait())
+                    except queue.Empty:
+                        break
+                recorded.set()
+            finally:
+                wf.close()
+                if stream.is_active():
+                    stream.stop_stream()
+                stream.close()
+                audio.terminate()
+                done.set()
+
+        worker = threading.Thread(target=record_for_duration, daemon=True)
+        worker.start()
+        done.wait(timeout=duration + 5)
+
+        try:
+            if not recorded.is_set():
+                return None
+            return self.process_audio_file(temp_audio_path)
+        finally:
+            if os.path.exists(temp_audio_path):
+                os.remove(temp_audio_path)
+
+    def process_voice_command_streaming(self, duration=5, segment_seconds=1.0):
+        """Record and transcribe concurrently instead of back to back.
+
+        The capture thread produces fixed-length PCM segments into a
+        queue (None is the end-of-stream sentinel) while this thread
+        feeds each one to the ASR model as it arrives, so wall-clock time
+        approaches max(recording, ASR) rather than their sum. File-mode
+        callers keep process_audio_file.
+        """
+        recorder = self.audio_recorder
+        segments: "queue.Queue[bytes | None]" = queue.Queue()
+
+        def record_segments():
+            try:
+                from pyaudio import PyAudio, paInt16  # type: ignore
+            except Exception:  # noqa: BLE001
+                self.log.error("PyAudio is required for interactive voice commands")
+                segments.put(None)
+                return
+            audio = PyAudio()
+            stream = audio.open(
+                format=paInt16,
+                channels=recorder.channels,
+                rate=recorder.rate,
+                input=True,
+                frames_per_buffer=recorder.chunk,
+            )
+            chunks_per_segment = max(1, int(recorder.rate * segment_seconds) // recorder.chunk)
+            # Ceiling division in integer math: float truncation here
+            # silently dropped the final partial chunk (~20 ms of audio).
+            total_chunks = int(-(-recorder.rate * duration // recorder.chunk))
+            # One segment-sized buffer allocated up front and reused:
+            # chunks land at an offset instead of growing a bytes object,
+            # so there is no per-chunk reallocation or final join pass.
+            seg_bytes = chunks_per_segment * recorder.chunk * recorder.channels * 2
+            buf = bytearray(seg_bytes)
+            off = 0
+            try:
+                for _ in range(total_chunks):
+                    data = stream.read(recorder.chunk, exception_on_overflow=False)
+                    buf[off:off + len(data)] = data
+                    off += len(data)
+                    if off >= seg_bytes:
+                        segments.put(bytes(buf[:off]))
+                        off = 0
+                if off:
+                    segments.put(bytes(buf[:off]))
+            finally:
+                segments.put(None)
+                stream.stop_stream()
+                stream.close()
+                audio.terminate()
+
+        threading.Thread(target=record_segments, daemon=True).start()
+
+        parts = []
+        while (segment := segments.get()) is not None:
+            text = self.asr_model.predict_buffer(segment, recorder.rate)
+            if text:
+                parts.append(text)
+        transcript = " ".join(parts).strip()
+        if not transcript:
+            return None
+        return self.process_command(transcript)
+
+    _COMPONENT_NAMES = (
+        "audio_recorder",
+        "asr_model",
+        "bible_service",
+        "nlp_processor",
+        "presentation_controller",
+    )
+
     def start(self, config_path: str | None = None):
         if not self._running:
-            self.config = load_config(config_path)
-            self.initialize_components()
+            config = load_config(config_path)
+            if config != self.config:
+                # Only a changed config invalidates the cached components;
+                # plain stop/start cycles reuse the already-built models
+                # instead of reloading them.
+                self.config = config
+                for name in self._COMPONENT_NAMES:
+                    self.__dict__.pop(name, None)
             self._running = True
+            self._log_info_on = self.log.isEnabledFor(logging.INFO)
             self.log.info("Kairos started")
 
     def stop(self):
         self._running = False
+        self.current_bible_reference = None
+        self.current_bible_parsed = None
         self.log.info("Kairos stopped")
 
     def get_status(self):
@@ -1,24 +1,36 @@
 import logging
+import logging.config
 import os
 
 
-_CONFIGURED = False
-
-
-def _ensure_configured():
-    global _CONFIGURED
-    if _CONFIGURED:
-        return
-    level_name = os.getenv("KAIROS_LOG_LEVEL", "INFO").upper()
-    level = getattr(logging, level_name, logging.INFO)
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+# One-shot configuration at import time replaces the _CONFIGURED flag
+# that every get_logger call had to re-check (and that could race under
+# threads). disable_existing_loggers stays False so loggers created
+# before this module imports keep working.
+if os.environ.get("KAIROS_LOG_DISABLED") != "1":
+    _level_name = os.getenv("KAIROS_LOG_LEVEL", "INFO").upper()
+    logging.config.dictConfig(
+        {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "formatters": {
+                "default": {
+                    "format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+                },
+            },
+            "handlers": {
+                "console": {
+                    "class": "logging.StreamHandler",
+                    "formatter": "default",
+                },
+            },
+            "root": {
+                "level": _level_name if hasattr(logging, _level_name) else "INFO",
+                "handlers": ["console"],
+            },
+        }
     )
-    _CONFIGURED = True
-
-
-def get_logger(name: str):
-    _ensure_configured()
-    return logging.getLogger(name)
 
+# Direct alias: callers pay one C-level lookup instead of a Python
+# wrapper that re-checks configuration state.
+get_logger = logging.getLogger
@@ -3,6 +3,7 @@
 Returns a tuple (intent_name, params_dict) or None when unknown.
 """
 
+import logging
 import re
 from typing import Optional, Tuple, Dict
 
@@ -10,41 +11,126 @@ from typing import Optional, Tuple, Dict
 from kairos.logging import get_logger
 
 
+# Compiled once at import: the chained `"..." in text` scans walked the
+# utterance once per keyword, while one alternation is a single C-level
+# pass (CPython's _sre is effectively the multi-keyword automaton here).
+# Group names double as intent names.
+_KEYWORD_RE = re.compile(
+    r"(?P<next_verse>next verse)"
+    r"|(?P<previous_verse>previous verse)"
+    r"|(?P<next_slide>\bnext\b)"
+    r"|(?P<previous_slide>\bprevious\b|\bback\b)"
+    r"|(?P<list_presentations>list presentations|show presentations)"
+    r"|(?P<current_slide>current slide|what slide)"
+)
+
+# Ladder order, not text order, decides ties: "go back to the next slide"
+# must resolve to next_slide as it always has, even though "back" appears
+# first in the string. The verse intents sit above the slide ones so
+# "next verse" never degrades to next_slide.
+_KEYWORD_PRIORITY = {
+    "next_verse": 0,
+    "previous_verse": 1,
+    "next_slide": 2,
+    "previous_slide": 3,
+    "list_presentations": 4,
+    "current_slide": 5,
+}
+
+_SLIDE_RE = re.compile(r"go to slide\s+(\d+)|slide\s+(\d+)")
+
+# Bible patterns: checked after the slide regex so "show slide 5" stays a
+# slide command; the reference shape mirrors BibleService._REF_RE.
+_TRANSLATION_RE = re.compile(r"(?:set|change|use)\s+(?:the\s+)?(?:bible\s+)?translation\s+(?:to\s+)?([a-z]+)")
+_BIBLE_VERSE_RE = re.compile(r"(?:show|read|display)\s+(?:the\s+)?(\d?\s?[a-z]+\s+\d+(?::\d+(?:-\d+)?)?)\b")
+
+
 class IntentProcessor:
-    def __init__(self):
-        # Placeholder for future extensibility
+    # Fixed attribute set: slots turn attribute access into C-array
+    # indexing and drop the per-instance __dict__.
+    __slots__ = ("log", "_log_debug_on", "provider")
+
+    def __init__(self, provider=None):
+        # Optional fallback provider (see kairos.nlp.provider_factory):
+        # consulted only when the built-in rules produce nothing, so
+        # model-backed recognition never slows the common commands.
+        self.provider = provider
         self.log = get_logger("kairos.nlp.intent")
+        # Cached so the per-utterance path skips record construction when
+        # debug logging is off (the common case).
+        self._log_debug_on = self.log.isEnabledFor(logging.DEBUG)
 
     def recognize_intent(self, user_input: str) -> Optional[Tuple[str, Dict]]:
-        text = (user_input or "").strip().lower()
-        if not text:
+        result = self._recognize_rules(user_input)
+        if result is None and self.provider is not None:
+            return self.provider.recognize_intent(user_input)
+        return result
+
+    def _recognize_rules(self, user_input: str) -> Optional[Tuple[str, Dict]]:
+        # Empty and whitespace-only utterances bail before any
+        # normalization or matching — this guard sits ahead of provider
+        # dispatch so a remote classifier is never paid for nothing.
+        if not user_input or user_input.isspace():
             return None
+        text = user_input.strip().lower()
+
+        # One linear pass collects every keyword hit; the best-ranked one
+        # wins, restoring the old ladder's priority semantics.
+        best_rank = None
+        best_name = None
+        for m in _KEYWORD_RE.finditer(text):
+            rank = _KEYWORD_PRIORITY[m.lastgroup]
+            if best_rank is None or rank < best_rank:
+                best_rank, best_name = rank, m.lastgroup
+                if rank == 0:
+                    break  # nothing can outrank the top entry
+        if best_name is not None:
+            return (best_name, {})
 
-        if "next" in text:
-            return ("next_slide", {})
-        if "previous" in text or "back" in text:
-            return ("previous_slide", {})
         if text.startswith("start presentation") or text.startswith("start slideshow"):
             return ("start_presentation", {})
         if text.startswith("stop presentation") or text.startswith("end presentation"):
             return ("stop_presentation", {})
-        if "list presentations" in text or "show presentations" in text:
-            return ("list_presentations", {})
-        if "current slide" in text or "what slide" in text:
-            return ("current_slide", {})
 
-        m = re.search(r"go to slide\s+(\d+)|slide\s+(\d+)", text)
+        m = _SLIDE_RE.search(text)
         if m:
             num = m.group(1) or m.group(2)
             try:
                 slide_number = int(num)
-                self.log.debug("Parsed slide number: %s", slide_number)
+                if self._log_debug_on:
+                    self.log.debug("Parsed slide number: %s", slide_number)
                 return ("set_slide", {"slide_number": slide_number})
             except ValueError:
                 return None
 
+        m = _TRANSLATION_RE.search(text)
+        if m:
+            return ("set_bible_translation", {"translation": m.group(1)})
+
+        m = _BIBLE_VERSE_RE.search(text)
+        if m:
+            return ("show_bible_verse", {"reference": m.group(1)})
+
         return None
 
+    def recognize_intents(self, user_inputs):
+        """Recognize intents for a batch of utterances.
+
+        Rules run locally first; whatever they miss goes to the fallback
+        provider in one recognize_intent_batch call, so a remote
+        classifier overlaps its round-trips instead of paying them one
+        utterance at a time.
+        """
+        results = [self._recognize_rules(text) for text in user_inputs]
+        if self.provider is None:
+            return results
+        pending = [i for i, r in enumerate(results) if r is None]
+        if pending:
+            resolved = self.provider.recognize_intent_batch([user_inputs[i] for i in pending])
+            for i, r in zip(pending, resolved):
+                results[i] = r
+        return results
+
 
 # Backward compatible alias
 IntentRecognizer = IntentProcessor
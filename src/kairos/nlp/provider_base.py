@@ -0,0 +1,103 @@
+"""Provider interface for intent recognition backends.
+
+A provider turns an utterance into the same (intent_name, params) tuple
+IntentProcessor produces, so rule-based and model-backed recognition are
+interchangeable.
+"""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+SUPPORTED_INTENTS = (
+    "next_slide",
+    "previous_slide",
+    "start_presentation",
+    "stop_presentation",
+    "list_presentations",
+    "current_slide",
+    "set_slide",
+    "show_bible_verse",
+    "set_bible_translation",
+    "next_verse",
+    "previous_verse",
+)
+
+
+class NLPProvider:
+    """Base class for intent providers.
+
+    recognize_intent returns (intent_name, params_dict) or None when the
+    utterance cannot be classified.
+    """
+
+    # Upper bound on in-flight requests for batch recognition; remote
+    # providers override it from config so a local Ollama queue is not
+    # overrun.
+    max_concurrency = 16
+
+    def get_provider_name(self):
+        raise NotImplementedError
+
+    def recognize_intent(self, text):
+        raise NotImplementedError
+
+    def recognize_intent_batch(self, texts):
+        """Recognize a batch of utterances concurrently.
+
+        Network-bound providers overlap their round-trips over a thread
+        pool (the same fan-out shape as ASRModel.evaluate and
+        BibleService.get_verses); the rule-based provider just maps.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as ex:
+            return list(ex.map(self.recognize_intent, texts))
+
+
+class ProviderRequestError(RuntimeError):
+    """A provider's backend call failed; the utterance was not classified."""
+
+
+_WS_RE = re.compile(r"\s+")
+
+
+class CachedProvider(NLPProvider):
+    """Mixin memoizing recognition results on the normalized utterance.
+
+    Voice control repeats the same handful of phrases, so for remote
+    providers a cache hit removes the network round-trip entirely. The
+    cache is per instance (so provider and model identity never leak
+    between keys, the same binding trick as BibleService) and the key is
+    the lowercased, whitespace-collapsed text — safe for temperature-0
+    classification. Subclasses implement _recognize_uncached.
+    """
+
+    _CACHE_SIZE = 512
+
+    def __init__(self):
+        self._recognize_cached = lru_cache(maxsize=self._CACHE_SIZE)(self._recognize_uncached)
+        self.stats = {"hits": 0, "misses": 0}
+
+    def recognize_intent(self, text):
+        if not text or text.isspace():
+            return None
+        norm = _WS_RE.sub(" ", text.strip().lower())
+        misses_before = self._recognize_cached.cache_info().misses
+        try:
+            result = self._recognize_cached(norm)
+        except ProviderRequestError:
+            # lru_cache does not store raising calls, so a transient
+            # backend failure never poisons the cache.
+            self.stats["misses"] += 1
+            return None
+        if self._recognize_cached.cache_info().misses > misses_before:
+            self.stats["misses"] += 1
+        else:
+            self.stats["hits"] += 1
+        if result is None:
+            return None
+        # Copy the params dict so a caller mutating it cannot poison the
+        # cached entry.
+        return (result[0], dict(result[1]))
+
+    def _recognize_uncached(self, norm_text):
+        raise NotImplementedError
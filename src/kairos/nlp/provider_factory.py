@@ -0,0 +1,49 @@
+"""Factory mapping provider ids from config to provider instances."""
+
+from kairos.nlp.provider_base import NLPProvider
+from kairos.nlp.providers import OllamaProvider, OpenAIProvider, RuleBasedProvider
+
+
+class TieredProvider(NLPProvider):
+    """Rules first, model only for the long tail.
+
+    The rule-based tier resolves the overwhelmingly common commands
+    ("next", "slide 5") in microseconds; the wrapped model provider is
+    only consulted when the rules return None, so its latency and cost
+    apply to ambiguous utterances alone.
+    """
+
+    def __init__(self, fast, slow):
+        self.fast = fast
+        self.slow = slow
+        self.max_concurrency = slow.max_concurrency
+
+    def get_provider_name(self):
+        return f"tiered({self.fast.get_provider_name()},{self.slow.get_provider_name()})"
+
+    def recognize_intent(self, text):
+        result = self.fast.recognize_intent(text)
+        if result is not None:
+            return result
+        return self.slow.recognize_intent(text)
+
+
+def create_provider(provider_id, config=None):
+    """Create a provider for an id like 'rules', 'ollama' or 'openai-gpt-4o-mini'.
+
+    Ids may carry a model suffix after the first dash; it overrides the
+    config model so 'ollama-mistral' works without a config block.
+    Model-backed providers come wrapped in TieredProvider so rule-covered
+    commands never pay for a model call.
+    """
+    if provider_id in (None, "", "rules", "rule_based"):
+        return RuleBasedProvider()
+    family, _, model = provider_id.partition("-")
+    if model:
+        config = dict(config or {})
+        config.setdefault("model", model)
+    if family == "ollama":
+        return TieredProvider(RuleBasedProvider(), OllamaProvider(config))
+    if family == "openai":
+        return TieredProvider(RuleBasedProvider(), OpenAIProvider(config))
+    raise ValueError(f"Unknown NLP provider: {provider_id}")
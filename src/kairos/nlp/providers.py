@@ -0,0 +1,280 @@
+"""Intent recognition providers: local rules, Ollama, and OpenAI."""
+
+import json
+import os
+import re
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from kairos.logging import get_logger
+from kairos.nlp.provider_base import (
+    CachedProvider,
+    NLPProvider,
+    ProviderRequestError,
+    SUPPORTED_INTENTS,
+)
+
+
+def _parse_intent_json(content):
+    """Extract an {"intent": ..., "params": {...}} object from model output."""
+    start = content.find("{")
+    end = content.rfind("}")
+    if start < 0 or end <= start:
+        return None
+    try:
+        data = json.loads(content[start:end + 1])
+    except ValueError:
+        return None
+    intent = data.get("intent")
+    if intent not in SUPPORTED_INTENTS:
+        return None
+    params = data.get("params")
+    return (intent, params if isinstance(params, dict) else {})
+
+
+# Compiled once at import: building the pattern lists per call cost a
+# list construction plus an re._compile cache lookup (dict hash on the
+# pattern string) for every pattern on every utterance. Tuples of
+# compiled Pattern objects make the hot path straight C-level search.
+_SLIDE_PATTERNS = tuple(
+    re.compile(p)
+    for p in (
+        r"go\s+to\s+slide\s+(\d+)",
+        r"jump\s+to\s+(\d+)",
+        r"show\s+slide\s+(\d+)",
+        r"slide\s+(\d+)",
+    )
+)
+_TRANSLATION_RE = re.compile(r"\b(kjv|esv|niv|nlt|nasb|nkjv|web)\b")
+_BIBLE_PATTERNS = (
+    re.compile(r"(?:show|read|display)\s+(?:the\s+)?(\d?\s?[a-z]+\s+\d+(?::\d+(?:-\d+)?)?)\b"),
+)
+
+# All keyword cues in one alternation: a single finditer pass collects
+# every hit, replacing the chain of `word in text` scans that walked the
+# utterance once per keyword (CPython's _sre is effectively the
+# multi-keyword automaton here). The decision tree then runs on the hit
+# set in the same order the old ladder did.
+_KEYWORD_RE = re.compile(
+    r"(?P<verse>\bverse\b)"
+    r"|(?P<next>\bnext\b|\bforward\b)"
+    r"|(?P<advance>\badvance\b)"
+    r"|(?P<previous>\bprevious\b|\bback\b|\bprior\b)"
+    r"|(?P<last>\blast\b)"
+    r"|(?P<start_presentation>start presentation|start slideshow|begin presentation)"
+    r"|(?P<stop_presentation>stop presentation|end presentation|stop slideshow)"
+    r"|(?P<list_presentations>list presentations|show presentations)"
+    r"|(?P<current_slide>current slide|what slide)"
+)
+
+
+class RuleBasedProvider(NLPProvider):
+    """Regex and keyword matching; resolves the common commands locally."""
+
+    def __init__(self):
+        self.log = get_logger("kairos.nlp.providers.rules")
+
+    def get_provider_name(self):
+        return "rules"
+
+    def recognize_intent(self, text):
+        if not text or text.isspace():
+            return None
+        text = text.strip().lower()
+
+        for pat in _SLIDE_PATTERNS:
+            m = pat.search(text)
+            if m:
+                return ("set_slide", {"slide_number": int(m.group(1))})
+
+        if "translation" in text:
+            m = _TRANSLATION_RE.search(text)
+            if m:
+                return ("set_bible_translation", {"translation": m.group(1)})
+
+        for pat in _BIBLE_PATTERNS:
+            m = pat.search(text)
+            if m:
+                return ("show_bible_verse", {"reference": m.group(1)})
+
+        hits = {m.lastgroup for m in _KEYWORD_RE.finditer(text)}
+        if not hits:
+            return None
+        if "verse" in hits:
+            if "next" in hits:
+                return ("next_verse", {})
+            if "previous" in hits or "last" in hits:
+                return ("previous_verse", {})
+        if "next" in hits or "advance" in hits:
+            return ("next_slide", {})
+        if "previous" in hits:
+            return ("previous_slide", {})
+        for name in ("start_presentation", "stop_presentation", "list_presentations", "current_slide"):
+            if name in hits:
+                return (name, {})
+        return None
+
+
+class OllamaProvider(CachedProvider):
+    """Classifies utterances with a local Ollama model."""
+
+    def __init__(self, config=None):
+        super().__init__()
+        config = config or {}
+        self.base_url = config.get("base_url", "http://localhost:11434").rstrip("/")
+        self.model = config.get("model", "llama3.2")
+        self.timeout = float(config.get("timeout", 10.0))
+        self.max_concurrency = int(config.get("max_concurrency", 16))
+        self.log = get_logger("kairos.nlp.providers.ollama")
+        # Built once: prefill is compute-bound, so a short static prefix
+        # keeps TTFT low for one-line commands, and its stability lets
+        # backends that cache prompt prefixes reuse it across calls.
+        self._prompt_prefix = (
+            "Classify the presentation voice command. Reply ONLY with JSON: "
+            f'{{"intent": one of {list(SUPPORTED_INTENTS)} or null, "params": {{}}}}. '
+            "Slide numbers go in params.slide_number (int); Bible references in "
+            'params.reference.\nCommand: "'
+        )
+        # One pooled session for the provider's lifetime: keep-alive
+        # reuses the socket to the Ollama host instead of paying a fresh
+        # TCP (and for remote hosts TLS) handshake per intent. The pool
+        # is sized for recognize_intent_batch's fan-out.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, pool_block=False)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update({"Connection": "keep-alive"})
+
+    def get_provider_name(self):
+        return f"ollama-{self.model}"
+
+    def validate_config(self):
+        """Return True when the Ollama host answers and knows the model."""
+        try:
+            response = self._session.get(f"{self.base_url}/api/tags", timeout=self.timeout)
+            response.raise_for_status()
+            models = response.json().get("models", [])
+        except Exception as e:  # noqa: BLE001
+            self.log.error("Ollama host unreachable: %s", e)
+            return False
+        names = {m.get("name", "").split(":")[0] for m in models}
+        return self.model.split(":")[0] in names
+
+    def close(self):
+        self._session.close()
+
+    def __del__(self):
+        try:
+            self._session.close()
+        except Exception:  # noqa: BLE001
+            pass
+
+    def _recognize_uncached(self, text):
+        # Streamed so parsing starts at the closing brace instead of
+        # after the model has finished any trailing commentary; breaking
+        # out of the with block drops the socket, which cancels the rest
+        # of the generation.
+        payload = {
+            "model": self.model,
+            "prompt": self._prompt_prefix + text + '" ->',
+            "stream": True,
+            "options": {"temperature": 0},
+        }
+        try:
+            with self._session.post(
+                f"{self.base_url}/api/generate", json=payload, timeout=self.timeout, stream=True
+            ) as response:
+                response.raise_for_status()
+                parts = []
+                result = None
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    piece = data.get("response", "")
+                    parts.append(piece)
+                    if "}" in piece:
+                        result = _parse_intent_json("".join(parts))
+                        if result is not None:
+                            break
+                    if data.get("done"):
+                        break
+                if result is None:
+                    result = _parse_intent_json("".join(parts))
+        except Exception as e:  # noqa: BLE001
+            self.log.error("Ollama request failed: %s", e)
+            raise ProviderRequestError(str(e)) from e
+        return result
+
+
+class OpenAIProvider(CachedProvider):
+    """Classifies utterances with an OpenAI chat model."""
+
+    def __init__(self, config=None):
+        super().__init__()
+        config = config or {}
+        self.model = config.get("model", "gpt-4o-mini")
+        self.api_key = config.get("api_key")
+        self.timeout = float(config.get("timeout", 10.0))
+        self.max_concurrency = int(config.get("max_concurrency", 16))
+        self.log = get_logger("kairos.nlp.providers.openai")
+        self._client = None
+        # Built once; see OllamaProvider._prompt_prefix for the prefill
+        # rationale. response_format below pins JSON output, so the
+        # format-guard examples the prompt used to carry are redundant.
+        self._system_prompt = (
+            "Classify the user's presentation command. Reply ONLY with JSON: "
+            f'{{"intent": one of {list(SUPPORTED_INTENTS)} or null, "params": {{}}}}. '
+            "Slide numbers go in params.slide_number (int); Bible references in params.reference."
+        )
+
+    def get_provider_name(self):
+        return f"openai-{self.model}"
+
+    def _ensure_client(self):
+        # openai is imported lazily (like PyAudio in the recorder) so the
+        # provider only requires it when actually used.
+        if self._client is None:
+            try:
+                from openai import OpenAI  # type: ignore
+            except Exception as e:  # noqa: BLE001
+                raise RuntimeError("openai is required for OpenAIProvider but is not installed") from e
+            self._client = OpenAI(
+                api_key=self.api_key or os.getenv("OPENAI_API_KEY"), timeout=self.timeout
+            )
+        return self._client
+
+    def _recognize_uncached(self, text):
+        client = self._ensure_client()
+        try:
+            stream = client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": self._system_prompt},
+                    {"role": "user", "content": text},
+                ],
+                temperature=0,
+                response_format={"type": "json_object"},
+                stream=True,
+            )
+            parts = []
+            result = None
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                parts.append(delta)
+                # Parse as soon as a closing brace arrives; closing the
+                # stream cancels the remaining tokens (and their cost).
+                if "}" in delta:
+                    result = _parse_intent_json("".join(parts))
+                    if result is not None:
+                        stream.close()
+                        break
+            if result is None:
+                result = _parse_intent_json("".join(parts))
+        except Exception as e:  # noqa: BLE001
+            self.log.error("OpenAI request failed: %s", e)
+            raise ProviderRequestError(str(e)) from e
+        return result
@@ -1,5 +1,8 @@
 # This file contains the logic for training AI models using the prepared datasets.
 
+import torch
+
+
 class Trainer:
     def __init__(self, model, dataset, optimizer, loss_fn):
         self.model = model
@@ -23,5 +26,10 @@ class Trainer:
     def save_model(self, filepath):
         torch.save(self.model.state_dict(), filepath)
 
+    def export_scripted(self, filepath):
+        # TorchScript checkpoint for kairos.asr.infer, which prefers
+        # torch.jit.load over unpickling an eager module.
+        torch.jit.script(self.model).save(filepath)
+
     def load_model(self, filepath):
         self.model.load_state_dict(torch.load(filepath))
\ No newline at end of file
@@ -1,7 +1,39 @@
-def load_audio_file(file_path):
-    """Load an audio file from the specified path."""
-    # Implementation goes here
-    pass
+def load_audio_file(file_path, sample_rate=None):
+    """Load an audio file as mono float32, optionally resampled.
+
+    Decodes with soundfile and resamples with soxr — both C libraries
+    that release the GIL — skipping librosa's dispatch layer and its
+    numba import chain. librosa.load remains the fallback when either
+    is absent. Returns (data, sample_rate).
+    """
+    try:
+        import numpy as np
+        import soundfile as sf
+        import soxr
+    except ImportError:
+        import librosa
+        return librosa.load(file_path, sr=sample_rate, mono=True)
+
+    data, sr = sf.read(file_path, dtype='float32', always_2d=False)
+    if data.ndim == 2:
+        data = data.mean(axis=1, dtype=np.float32)
+    if sample_rate and sr != sample_rate:
+        data = soxr.resample(data, sr, sample_rate, quality='HQ')
+        sr = sample_rate
+    return data, sr
+
+def load_audio_files(file_paths, sample_rate=None, n_workers=8):
+    """Load several audio files concurrently.
+
+    Decode and resample both run in GIL-releasing C code, so threads give
+    real parallelism up to the disk bandwidth ceiling. Results come back
+    in input order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=n_workers) as ex:
+        return list(ex.map(lambda p: load_audio_file(p, sample_rate), file_paths))
+
 
 def save_audio_file(file_path, audio_data):
     """Save audio data to the specified file path."""
@@ -10,8 +42,8 @@ def save_audio_file(file_path, audio_data):
 
 def normalize_audio(audio_data):
     """Normalize the audio data to a standard range."""
-    # Implementation goes here
-    pass
+    from kairos.audio.preprocessing import normalize_audio as _normalize
+    return _normalize(audio_data)
 
 def segment_audio(audio_data, segment_duration):
     """Segment the audio data into chunks of specified duration."""
@@ -15,3 +15,18 @@ async def test_rule_nlu_basic():
     assert r4.intent == 'GoToSong'
     assert 'song_title' in r4.params
 
+
+@pytest.mark.asyncio
+async def test_rule_nlu_priority_over_song():
+    # Slide keywords outrank the song rule even when a song trigger word
+    # appears earlier in the utterance.
+    nlu = RuleBasedNLU()
+    for text in ('show next slide', 'go to next slide', 'open the next slide'):
+        r = await nlu.detect_intent(text)
+        assert r.intent == 'NextSlide', text
+    r = await nlu.detect_intent('show previous slide')
+    assert r.intent == 'PreviousSlide'
+    r2 = await nlu.detect_intent('go to verse 2')
+    assert r2.intent == 'GoToSong'
+    assert r2.params['song_title'] == 'verse 2'
+
@@ -0,0 +1,25 @@
+import os
+
+import yaml
+
+from kairos.asr.model import ASRModel, ENGINES
+
+_DEFAULT_CONFIG = os.path.join(
+    os.path.dirname(__file__), "..", "..", "configs", "default.yaml"
+)
+
+
+def test_default_config_engine_resolves():
+    # The shipped default config must always name an engine the dispatch
+    # table knows; "baseline" is the legacy spelling and aliases to the
+    # default engine.
+    with open(_DEFAULT_CONFIG) as f:
+        cfg = yaml.safe_load(f)
+    model = ASRModel(model_name=cfg["asr"]["model_name"])
+    assert model.model_name in ENGINES
+
+
+def test_baseline_aliases_to_google():
+    assert ASRModel(model_name="baseline").model_name == "google"
+    # Real engine names pass through untouched
+    assert ASRModel(model_name="sphinx").model_name == "sphinx"